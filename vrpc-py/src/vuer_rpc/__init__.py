@@ -8,7 +8,7 @@ Main exports:
     - ZData: Extensible type encoding for numpy, torch, PIL, and custom types
     - Message types: Message, ClientEvent, ServerEvent, RPCRequest, RPCResponse
     - Event factories: set_event, add_event, update_event, upsert_event, remove_event
-    - Serializers: MessagePackSerializer, JSONSerializer
+    - Serializers: MessagePackSerializer, JSONSerializer, PickleSerializer
 
 Example:
     >>> import numpy as np
@@ -29,7 +29,7 @@ Example:
 
 # ZData encoding
 from .zdata import ZData
-from .type_registry import TYPE_REGISTRY, TypeRegistry
+from .type_registry import TYPE_REGISTRY, TypeRegistry, struct_codec
 
 # Message types
 from .types import (
@@ -41,6 +41,7 @@ from .types import (
     VuerComponent,
     EventType,
     current_timestamp,
+    event_batch,
     create_client_event,
     create_server_event,
     create_rpc_request,
@@ -61,6 +62,7 @@ from .events import (
 from .serializers import (
     MessagePackSerializer,
     JSONSerializer,
+    PickleSerializer,
     msgpack_serializer,
     json_serializer,
 )
@@ -72,6 +74,7 @@ __all__ = [
     "ZData",
     "TYPE_REGISTRY",
     "TypeRegistry",
+    "struct_codec",
     # Types
     "Message",
     "ClientEvent",
@@ -81,6 +84,7 @@ __all__ = [
     "VuerComponent",
     "EventType",
     "current_timestamp",
+    "event_batch",
     "create_client_event",
     "create_server_event",
     "create_rpc_request",
@@ -95,6 +99,7 @@ __all__ = [
     # Serializers
     "MessagePackSerializer",
     "JSONSerializer",
+    "PickleSerializer",
     "msgpack_serializer",
     "json_serializer",
 ]
@@ -4,32 +4,218 @@ Built-in type encoders/decoders for ZData.
 This module registers numpy support by default, which is a core dependency.
 """
 
+from typing import Optional
+
 import numpy as np
 from .type_registry import TYPE_REGISTRY, ZDataDict
 
+# dtypes a JSON number list carries losslessly (and orjson writes natively)
+_JSON_LIST_DTYPES = frozenset(np.dtype(t) for t in (
+    np.bool_,
+    np.int8, np.int16, np.int32, np.int64,
+    np.uint8, np.uint16, np.uint32, np.uint64,
+    np.float16, np.float32, np.float64,
+))
+
+# Parsed dtypes keyed by their wire string, so decoding skips np.dtype() parsing
+_DTYPE_CACHE: dict[str, np.dtype] = {}
+_DTYPE_CACHE_SIZE = 64
+
+
+def _get_dtype(dtype_str: str) -> np.dtype:
+    """Return the dtype for a wire dtype string, caching common ones."""
+    dtype = _DTYPE_CACHE.get(dtype_str)
+    if dtype is None:
+        dtype = np.dtype(dtype_str)
+        # dtype strings come from a small alphabet; the cap only guards
+        # against unbounded growth from unusual (e.g. structured) dtypes
+        if len(_DTYPE_CACHE) < _DTYPE_CACHE_SIZE:
+            _DTYPE_CACHE[dtype_str] = dtype
+    return dtype
+
+
+# Wire strings keyed by dtype; str(dtype) costs microseconds per call, most
+# of the time spent encoding a small array
+_DTYPE_STR_CACHE: dict[np.dtype, str] = {}
+
+
+def _dtype_str(dtype: np.dtype) -> str:
+    """Return the wire string for a dtype, caching common ones."""
+    dtype_str = _DTYPE_STR_CACHE.get(dtype)
+    if dtype_str is None:
+        dtype_str = str(dtype)
+        if len(_DTYPE_STR_CACHE) < _DTYPE_CACHE_SIZE:
+            _DTYPE_STR_CACHE[dtype] = dtype_str
+    return dtype_str
+
+
+# ndarray subclasses with state a plain array payload would silently drop
+# (the mask, matrix semantics); others such as np.memmap encode as their base
+_UNSUPPORTED_SUBCLASSES = (np.ma.MaskedArray, np.matrix)
+
+
+def _check_plain_array(data: np.ndarray):
+    """Raise TypeError for ndarray subclasses that cannot encode as numpy.ndarray."""
+    if type(data) is not np.ndarray and isinstance(data, _UNSUPPORTED_SUBCLASSES):
+        raise TypeError(
+            f"Cannot encode {type(data).__name__} as numpy.ndarray; "
+            "convert it to a plain ndarray first"
+        )
+
+
+# Payload size up to which copying to bytes beats a zero-copy memoryview
+_INLINE_COPY_MAX = 8 * 1024
+
+
+def _byte_view(data: np.ndarray):
+    """Flat uint8 memoryview over a C-contiguous array, without copying."""
+    # memoryview.cast rejects shapes with a zero, so empty arrays get b""
+    if not data.size:
+        return b""
+    try:
+        return data.data.cast("B")
+    except ValueError:
+        # dtypes without a buffer-protocol format (datetime64, timedelta64)
+        return data.reshape(-1).view(np.uint8).data
+
 
 def _encode_numpy(data: np.ndarray) -> ZDataDict:
-    """Encode NumPy array to ZData format."""
-    binary = data.tobytes()
+    """
+    Encode NumPy array to ZData format.
+
+    The payload of a large array is a flat uint8 memoryview over the array
+    buffer rather than a ``tobytes()`` copy, so msgpack writes straight from
+    the array memory. The memoryview holds a reference to the (contiguous)
+    array, keeping the buffer alive for as long as the encoded dict is.
+    Arrays up to ``_INLINE_COPY_MAX`` bytes are copied instead, since
+    exporting a memoryview costs more than copying a few KiB.
+    """
+    _check_plain_array(data)
+    if data.nbytes <= _INLINE_COPY_MAX:
+        # tobytes() also flattens strided arrays in C order
+        payload = data.tobytes()
+    else:
+        if not data.flags.c_contiguous:
+            data = np.ascontiguousarray(data)
+        payload = _byte_view(data)
     return {
         "ztype": "numpy.ndarray",
-        "b": binary,
-        "dtype": str(data.dtype),
+        "b": payload,
+        "dtype": _dtype_str(data.dtype),
+        # Kept as a plain int array: the TS, Rust and Swift decoders read it
         "shape": data.shape,
     }
 
 
+def _encode_numpy_json(data: np.ndarray) -> Optional[ZDataDict]:
+    """
+    Encode a numeric NumPy array for JSON as a flat list of numbers.
+
+    Text formats gain nothing from a binary payload, so instead of the ``b``
+    field (which JSON would have to base64 encode) the array is stored under
+    ``data`` as a flat C-ordered 1-D array, which the JSON backend writes out
+    as a list of numbers. Returns None for dtypes, or non-finite floats, that a
+    JSON number list cannot represent exactly.
+    """
+    if data.dtype not in _JSON_LIST_DTYPES:
+        return None
+    if data.dtype.kind == "f" and not np.isfinite(data).all():
+        return None
+    return {
+        "ztype": "numpy.ndarray",
+        "dtype": _dtype_str(data.dtype),
+        "shape": data.shape,
+        "data": data.ravel(),
+    }
+
+
 def _decode_numpy(zdata: ZDataDict) -> np.ndarray:
-    """Decode ZData back to NumPy array."""
-    array = np.frombuffer(zdata["b"], dtype=zdata["dtype"])
-    array = array.reshape(zdata["shape"])
-    return array
-
-
-# Register numpy (always available since it's a core dependency)
-TYPE_REGISTRY.register(
-    "numpy.ndarray",
-    _encode_numpy,
-    _decode_numpy,
-    type_class=np.ndarray
-)
+    """
+    Decode ZData back to NumPy array.
+
+    The array aliases the payload buffer directly (no reshape step), so it is
+    read-only whenever the payload is an immutable ``bytes`` object. Arrays
+    sent as a JSON number list (see ``_encode_numpy_json``) are rebuilt from
+    the list instead.
+    """
+    if "b" not in zdata:
+        array = np.array(zdata["data"], dtype=_get_dtype(zdata["dtype"]))
+        return array.reshape(tuple(zdata["shape"]))
+
+    return np.ndarray(
+        shape=tuple(zdata["shape"]),
+        dtype=_get_dtype(zdata["dtype"]),
+        buffer=zdata["b"],
+    )
+
+
+def encode_numpy_batch(arrays: list[np.ndarray]) -> ZDataDict:
+    """
+    Encode a list of same-dtype NumPy arrays as a single ZData record.
+
+    The arrays are copied into one contiguous buffer, with their shapes and
+    element offsets stored alongside, so N small arrays cost one header and
+    one payload instead of N.
+
+    Args:
+        arrays: Non-empty list of arrays sharing a dtype (shapes may differ)
+
+    Returns:
+        ZDataDict with ztype "numpy.ndarray.batch"
+    """
+    if not arrays:
+        raise ValueError("numpy.ndarray.batch requires at least one array")
+
+    dtype = arrays[0].dtype
+    offsets = []
+    total = 0
+    for array in arrays:
+        _check_plain_array(array)
+        if array.dtype != dtype:
+            raise TypeError(
+                f"All arrays must share a dtype, got {array.dtype} and {dtype}"
+            )
+        offsets.append(total)
+        total += array.size
+
+    flat = np.empty(total, dtype=dtype)
+    # Contiguous arrays are copied as raw bytes, which skips numpy's per-call
+    # broadcasting setup; that dominates for the small arrays batches target
+    out = _byte_view(flat)
+    itemsize = dtype.itemsize
+    for array, offset in zip(arrays, offsets):
+        if array.size and array.flags.c_contiguous and not array.dtype.hasobject:
+            start = offset * itemsize
+            out[start:start + array.nbytes] = _byte_view(array)
+        else:
+            np.copyto(flat[offset:offset + array.size].reshape(array.shape), array)
+
+    return {
+        "ztype": "numpy.ndarray.batch",
+        "b": out,
+        "dtype": _dtype_str(dtype),
+        "shapes": [array.shape for array in arrays],
+        "offsets": offsets,
+    }
+
+
+def _decode_numpy_batch(zdata: ZDataDict) -> list[np.ndarray]:
+    """Decode a batch record back to a list of arrays viewing one buffer."""
+    dtype = _get_dtype(zdata["dtype"])
+    flat = np.frombuffer(zdata["b"], dtype=dtype)
+    offsets = zdata["offsets"]
+    # Each array ends where the next one starts, so sizes need no shape product
+    ends = [*offsets[1:], flat.size]
+    return [
+        flat[start:end].reshape(shape)
+        for shape, start, end in zip(zdata["shapes"], offsets, ends)
+    ]
+
+
+# Register numpy (always available since it's a core dependency), including
+# subclasses such as np.memmap. Batches are opt-in via ZData.encode_batch, so
+# no type class is registered for them.
+TYPE_REGISTRY.register_many([
+    ("numpy.ndarray", _encode_numpy, _decode_numpy, np.ndarray, None, False, True),
+    ("numpy.ndarray.batch", encode_numpy_batch, _decode_numpy_batch),
+])
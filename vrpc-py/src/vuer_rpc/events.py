@@ -28,7 +28,7 @@ def set_event(
         {'ts': 1234567890, 'etype': 'SET', 'data': {...}}
     """
     return {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": "SET",
         "data": scene,
     }
@@ -55,7 +55,7 @@ def add_event(
         {'ts': 1234567890, 'etype': 'ADD', 'data': {'nodes': [...], 'to': 'children'}}
     """
     return {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": "ADD",
         "data": {
             "nodes": nodes,
@@ -83,7 +83,7 @@ def update_event(
         {'ts': 1234567890, 'etype': 'UPDATE', 'data': {'nodes': [...]}}
     """
     return {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": "UPDATE",
         "data": {
             "nodes": nodes,
@@ -112,7 +112,7 @@ def upsert_event(
         {'ts': 1234567890, 'etype': 'UPSERT', 'data': {'nodes': [...], 'to': 'children'}}
     """
     return {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": "UPSERT",
         "data": {
             "nodes": nodes,
@@ -140,7 +140,7 @@ def remove_event(
         {'ts': 1234567890, 'etype': 'REMOVE', 'data': {'keys': ['box1', 'box2']}}
     """
     return {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": "REMOVE",
         "data": {
             "keys": keys,
@@ -169,7 +169,7 @@ def timeout_event(
         {'ts': 1234567890, 'etype': 'TIMEOUT', 'data': {'timeout': 1.5, 'fn': 'updateScene'}}
     """
     return {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": "TIMEOUT",
         "data": {
             "timeout": timeout,
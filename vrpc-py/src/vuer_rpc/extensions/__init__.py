@@ -13,20 +13,76 @@ Example:
     >>> encoded = ZData.encode(tensor)
 """
 
+import importlib
+import importlib.util
+import sys
+
+from ..type_registry import TYPE_REGISTRY
+
 __all__ = []
 
-# Optional imports - these will register types when imported
-try:
-    from . import torch_support
-    __all__.append('torch_support')
-except ImportError:
-    pass
 
-try:
-    from . import image_support
-    __all__.append('image_support')
-except ImportError:
-    pass
+# Extensions whose dependency is slow to import, keyed by submodule:
+# (ztype, dependency, module and name of its class, encoder, decoder)
+_LAZY_EXTENSIONS = {
+    "torch_support": (
+        "torch.Tensor", "torch", "torch", "Tensor", "_encode_torch", "_decode_torch",
+    ),
+    "image_support": (
+        "image", "PIL", "PIL.Image", "Image", "_encode_pil_image", "_decode_pil_image",
+    ),
+}
+
+
+def _register_lazy(submodule, type_name, class_module, class_name, encoder, decoder):
+    """
+    Register an extension's type without importing its dependency up front.
+
+    Importing torch takes hundreds of milliseconds, and PIL tens, which CLI
+    tools that never send tensors or images should not pay. Until the type is
+    first encoded or decoded, these stand-ins take the place of the extension
+    module; that first use imports it, which then registers the real handlers.
+    """
+    def is_instance(obj):
+        # Any instance implies its module has already been imported
+        module = sys.modules.get(class_module)
+        return module is not None and isinstance(obj, getattr(module, class_name))
+
+    def encode(data):
+        return getattr(_import_extension(submodule), encoder)(data)
+
+    def decode(zdata):
+        return getattr(_import_extension(submodule), decoder)(zdata)
+
+    TYPE_REGISTRY.register(
+        type_name, encode, decode, type_checker=is_instance, cache_by_type=True
+    )
+
+
+def _import_extension(submodule):
+    # Not ``from . import``, which would recurse through __getattr__ below
+    return importlib.import_module(f"{__name__}.{submodule}")
+
+
+def __getattr__(name):
+    # Lazily registered extensions are imported on first access
+    if name in _LAZY_EXTENSIONS and name in __all__:
+        return _import_extension(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Optional imports - these will register types when imported
+for _submodule, (_type_name, _dependency, _class_module, *_handlers) in _LAZY_EXTENSIONS.items():
+    if _class_module in sys.modules:
+        try:
+            _import_extension(_submodule)
+            __all__.append(_submodule)
+        except ImportError:
+            pass
+    elif importlib.util.find_spec(_dependency) is not None:
+        _register_lazy(_submodule, _type_name, _class_module, *_handlers)
+        __all__.append(_submodule)
+del _submodule, _type_name, _dependency, _class_module, _handlers
 
 try:
     from . import safetensors_support
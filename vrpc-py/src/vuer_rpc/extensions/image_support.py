@@ -6,7 +6,9 @@ Import this module to register PIL Image encoding/decoding:
     >>> # Now PIL.Image is supported
 """
 
+import os
 from io import BytesIO
+from typing import Optional
 from ..type_registry import TYPE_REGISTRY, ZDataDict
 
 try:
@@ -19,22 +21,83 @@ except ImportError:
         "uv pip install 'vuer-rpc[image]' or pip install Pillow"
     )
 
+# Opt-in faster PNG encoder: VMP_PNG_ENCODER=fpnge routes PNG output through
+# the fpnge package when it is importable, bypassing PIL's zlib encoder.
+_fpnge = None
+if os.environ.get("VMP_PNG_ENCODER") == "fpnge":
+    try:
+        import fpnge as _fpnge
+    except ImportError:
+        pass
+
+# zlib level for PNG output; PIL's default of 6 dominates encode time, while
+# level 1 is several times faster for a slightly larger payload.
+PNG_COMPRESS_LEVEL = 1
+
+# JPEG quality used by encode_image unless given explicitly
+JPEG_QUALITY = 90
+
+# Formats whose source bytes are sent as-is for images that were never loaded
+_PASSTHROUGH_FORMATS = frozenset({"PNG", "JPEG", "WEBP"})
+
 
 def _encode_pil_image(data: PILImage) -> ZDataDict:
     """Encode PIL Image to ZData format."""
-    with BytesIO() as buffer:
-        # Preserve format if available, otherwise use PNG
-        fmt = getattr(data, 'format', None) or 'PNG'
-        data.save(buffer, format=fmt)
-        binary = buffer.getvalue()
+    # Preserve format if available, otherwise use PNG
+    fmt = getattr(data, 'format', None) or 'PNG'
+
+    # PIL drops fp once pixel data is loaded, and every mutation loads first.
+    # An image still backed by an in-memory file, such as one returned by
+    # _decode_pil_image, is therefore unmodified, and its source bytes can
+    # be sent without decoding and re-encoding. draft() is the exception: it
+    # changes mode and size without loading, leaving a decoder config behind.
+    fp = getattr(data, 'fp', None)
+    if (
+        isinstance(fp, BytesIO)
+        and fmt in _PASSTHROUGH_FORMATS
+        and data.tell() == 0
+        and not getattr(data, 'decoderconfig', ())
+    ):
+        return {
+            "ztype": "image",
+            "b": fp.getvalue(),
+        }
+
     return {
         "ztype": "image",
-        "b": binary,
+        "b": _save_image(data, fmt),
     }
 
 
+def _save_image(data: PILImage, fmt: str, quality: Optional[int] = None) -> bytes:
+    """
+    Encode an image to the bytes of the given file format.
+
+    JPEG uses PIL's default quality unless one is given, as encode_image does.
+    """
+    if fmt == 'PNG' and _fpnge is not None:
+        return _fpnge.fromPIL(data)
+
+    with BytesIO() as buffer:
+        if fmt == 'PNG':
+            data.save(buffer, format=fmt, compress_level=PNG_COMPRESS_LEVEL)
+        elif fmt == 'JPEG' and quality is not None:
+            data.save(buffer, format=fmt, quality=quality)
+        else:
+            data.save(buffer, format=fmt)
+        return buffer.getvalue()
+
+
 def _decode_pil_image(zdata: ZDataDict) -> PILImage:
-    """Decode ZData back to PIL Image."""
+    """
+    Decode ZData back to PIL Image.
+
+    The image is returned lazily: only the header is parsed here, and pixel
+    data is decoded on first access. Until then the image is known to be
+    unmodified, so relaying it re-sends the received bytes without any
+    decode or re-encode (see _encode_pil_image). Call ``img.load()`` to move
+    the decode cost to a predictable point instead.
+    """
     from PIL import Image
     buffer = BytesIO(zdata["b"])
     return Image.open(buffer)
@@ -46,5 +109,37 @@ if PIL_AVAILABLE:
         "image",
         _encode_pil_image,
         _decode_pil_image,
-        type_class=PILImage
+        type_class=PILImage,
+        # Opened images are format subclasses (PngImageFile, JpegImageFile...)
+        include_subclasses=True,
     )
+
+
+def encode_image(data: PILImage, fmt: str = "auto", quality: int = JPEG_QUALITY) -> ZDataDict:
+    """
+    Explicitly encode a PIL image in a chosen file format.
+
+    Automatic encoding keeps the image's own format, or lossless PNG. Use
+    this helper to trade exactness for speed and size. JPEG is much faster
+    to encode than PNG for photographic content.
+
+    Args:
+        data: PIL image to encode
+        fmt: File format such as "JPEG", "PNG" or "WEBP". "auto" picks
+            JPEG for opaque RGB and grayscale images, and PNG otherwise.
+        quality: JPEG quality
+
+    Returns:
+        ZDataDict with the encoded image
+
+    Example:
+        >>> from vmp_py.extensions.image_support import encode_image
+        >>> encoded = encode_image(frame, fmt="JPEG", quality=80)
+    """
+    if fmt == "auto":
+        opaque = "transparency" not in data.info
+        fmt = "JPEG" if data.mode in ("RGB", "L") and opaque else "PNG"
+    return {
+        "ztype": "image",
+        "b": _save_image(data, fmt, quality),
+    }
@@ -7,6 +7,10 @@ Import this module to register safetensors encoding/decoding:
     >>> # Now safetensors format is supported
 """
 
+import json
+import struct
+from itertools import accumulate
+
 import numpy as np
 from ..type_registry import TYPE_REGISTRY, ZDataDict
 
@@ -20,6 +24,87 @@ except ImportError:
         "uv pip install 'vuer-rpc[safetensors]' or pip install safetensors"
     )
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# numpy dtypes that safetensors.numpy can load, by safetensors dtype name.
+# Safetensors data is always little-endian, so the keys are explicitly
+# little-endian; big-endian arrays are byteswapped while being copied.
+_SAFETENSORS_DTYPES = {
+    np.dtype("<f8"): "F64",
+    np.dtype("<f4"): "F32",
+    np.dtype("<f2"): "F16",
+    np.dtype("<i8"): "I64",
+    np.dtype("<u8"): "U64",
+    np.dtype("<i4"): "I32",
+    np.dtype("<u4"): "U32",
+    np.dtype("<i2"): "I16",
+    np.dtype("<u2"): "U16",
+    np.dtype("i1"): "I8",
+    np.dtype("u1"): "U8",
+    np.dtype("?"): "BOOL",
+    np.dtype("<c8"): "C64",
+}
+
+_NUMPY_DTYPES = {name: dtype for dtype, name in _SAFETENSORS_DTYPES.items()}
+
+
+def _save(names: list, arrays: list) -> bytearray:
+    """
+    Write a safetensors buffer with one copy per array.
+
+    safetensors.numpy.save goes through arr.tobytes() for every array, so
+    each tensor is copied twice. Here the header is built first, then each
+    array is copied straight into its slot of a single preallocated buffer.
+
+    Raises KeyError for dtypes outside _SAFETENSORS_DTYPES (in either byte
+    order).
+    """
+    dtypes = _SAFETENSORS_DTYPES
+    nbytes = [array.nbytes for array in arrays]
+    offsets = list(accumulate(nbytes, initial=0))
+    header = {
+        name: {
+            "dtype": dtypes.get(array.dtype) or dtypes[array.dtype.newbyteorder("<")],
+            "shape": array.shape,
+            "data_offsets": (begin, end),
+        }
+        for name, array, begin, end in zip(names, arrays, offsets, offsets[1:])
+    }
+
+    if ORJSON_AVAILABLE:
+        header_bytes = orjson.dumps(header)
+    else:
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    # Tensor data starts 8-byte aligned; the format pads the header with spaces
+    header_end = 8 + len(header_bytes)
+    start = header_end + (-header_end & 7)
+
+    # The total size is known up front, so the output is allocated exactly
+    # once and every write below lands in place
+    buffer = bytearray(start + offsets[-1])
+    struct.pack_into("<Q", buffer, 0, start - 8)
+    buffer[8:header_end] = header_bytes
+    buffer[header_end:start] = b" " * (start - header_end)
+
+    body = memoryview(buffer)[start:]
+    out = np.frombuffer(buffer, dtype=np.uint8, offset=start)
+    for array, begin, end in zip(arrays, offsets, offsets[1:]):
+        if begin == end:
+            continue
+        if array.flags.c_contiguous and array.dtype in dtypes:
+            # A plain memcpy, much cheaper per array than np.copyto
+            body[begin:end] = array.data.cast("B")
+        else:
+            # copyto handles strided and big-endian input in a single pass
+            target = out[begin:end].view(array.dtype.newbyteorder("<"))
+            np.copyto(target.reshape(array.shape), array)
+    return buffer
+
 
 def _encode_safetensor_dict(data: dict) -> ZDataDict:
     """
@@ -35,12 +120,21 @@ def _encode_safetensor_dict(data: dict) -> ZDataDict:
     if not isinstance(data, dict):
         raise TypeError("safetensor_dict requires a dictionary")
 
-    for key, value in data.items():
-        if not isinstance(value, np.ndarray):
-            raise TypeError(f"All values must be numpy arrays, got {type(value)} for key '{key}'")
-
-    # Serialize to safetensors format
-    binary = save(data)
+    names = list(data)
+    arrays = list(data.values())
+    # Exact type checks are cheapest; only fall back to isinstance (which
+    # also accepts subclasses) to find the offending value
+    if not all(type(value) is np.ndarray for value in arrays):
+        for key, value in data.items():
+            if not isinstance(value, np.ndarray):
+                raise TypeError(f"All values must be numpy arrays, got {type(value)} for key '{key}'")
+
+    # Serialize to safetensors format. Dtypes outside the common set are left
+    # to safetensors itself.
+    try:
+        binary = _save(names, arrays)
+    except KeyError:
+        binary = save(data)
 
     return {
         "ztype": "safetensor.dict",
@@ -48,9 +142,46 @@ def _encode_safetensor_dict(data: dict) -> ZDataDict:
     }
 
 
+def _load(binary) -> dict:
+    """
+    Read a safetensors buffer as read-only numpy views, without copying.
+
+    Only the header is parsed; each array is an np.frombuffer view over its
+    slice of the buffer, so decoding is O(header) rather than O(bytes).
+    """
+    view = memoryview(binary).cast("B")
+    (header_size,) = struct.unpack_from("<Q", view, 0)
+    start = 8 + header_size
+    if ORJSON_AVAILABLE:
+        header = orjson.loads(view[8:start])
+    else:
+        header = json.loads(bytes(view[8:start]))
+    header.pop("__metadata__", None)
+
+    result = {}
+    for key, info in header.items():
+        dtype = _NUMPY_DTYPES[info["dtype"]]
+        begin, end = info["data_offsets"]
+        array = np.frombuffer(
+            view, dtype=dtype, count=(end - begin) // dtype.itemsize, offset=start + begin
+        )
+        result[key] = array.reshape(info["shape"])
+    return result
+
+
 def _decode_safetensor_dict(zdata: ZDataDict) -> dict:
-    """Decode safetensors binary back to dictionary of numpy arrays."""
-    return load(zdata["b"])
+    """
+    Decode safetensors binary back to dictionary of numpy arrays.
+
+    The arrays are read-only views over the received buffer. Copy them with
+    ``arr.copy()`` if you need to modify them in place.
+    """
+    try:
+        return _load(zdata["b"])
+    except KeyError:
+        # Dtypes outside the common set (e.g. from other writers) go through
+        # safetensors itself; load() only accepts bytes
+        return load(bytes(zdata["b"]))
 
 
 def _is_safetensor_dict(data) -> bool:
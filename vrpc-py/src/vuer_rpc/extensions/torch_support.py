@@ -7,6 +7,7 @@ Import this module to register PyTorch tensor encoding/decoding:
 """
 
 import numpy as np
+from ..builtin_types import _byte_view, _dtype_str, _get_dtype
 from ..type_registry import TYPE_REGISTRY, ZDataDict
 
 try:
@@ -22,21 +23,28 @@ except ImportError:
 
 def _encode_torch(data: torch.Tensor) -> ZDataDict:
     """Encode PyTorch tensor to ZData format."""
-    # Convert to CPU numpy, then to binary
-    np_array = data.cpu().numpy()
-    binary = np_array.tobytes()
+    tensor = data.detach()
+    if tensor.device.type != "cpu":
+        tensor = tensor.cpu()
+    # Expose the tensor memory without copying; the memoryview keeps the
+    # numpy array, and through it the tensor storage, alive.
+    np_array = tensor.contiguous().numpy()
     return {
         "ztype": "torch.Tensor",
-        "b": binary,
-        "dtype": str(np_array.dtype),
+        "b": _byte_view(np_array),
+        "dtype": _dtype_str(np_array.dtype),
         "shape": np_array.shape,
     }
 
 
 def _decode_torch(zdata: ZDataDict) -> torch.Tensor:
     """Decode ZData back to PyTorch tensor."""
-    array = np.frombuffer(zdata["b"], dtype=zdata["dtype"])
-    array = array.reshape(zdata["shape"]).copy()
+    array = np.frombuffer(zdata["b"], dtype=_get_dtype(zdata["dtype"]))
+    array = array.reshape(zdata["shape"])
+    # Torch tensors are always writable, so only read-only payloads (such as
+    # bytes from msgpack) need a copy; writable buffers are shared as-is.
+    if not array.flags.writeable:
+        array = array.copy()
     return torch.from_numpy(array)
 
 
@@ -5,14 +5,57 @@ Provides MessagePack and JSON serialization with support for
 ZData encoding of special types (numpy, torch, PIL).
 """
 
+import base64
+import importlib.util
 import json
+import math
+import os
+import re
+import pickle
+import tempfile
+import threading
 import msgpack
-from typing import Any, Protocol
-from .zdata import ZData
+import numpy as np
+from typing import Any, Optional, Protocol, Union
+from .type_registry import TYPE_REGISTRY
+from .builtin_types import (
+    _byte_view, _check_plain_array, _dtype_str, _encode_numpy_json, _get_dtype,
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# blosc2 takes longer to import than the rest of the package, so it is only
+# located here and imported once a serializer uses compression
+BLOSC2_AVAILABLE = importlib.util.find_spec("blosc2") is not None
+
+# Payload compression codecs supported by MessagePackSerializer
+_COMPRESSION_CODECS = ("lz4",)
+
+# Messages larger than this are packed by a Packer that is then discarded,
+# since a reset() Packer keeps its peak buffer allocated
+_PACKER_BUFFER_MAX = 1 << 20
+
+# orjson reads integers outside the 64-bit range as floats; any run of 19
+# digits may be one, so payloads containing one are parsed by the stdlib
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
+
+# ZData type of arrays handed over through a memory-mapped file
+_MMAP_ZTYPE = "numpy.ndarray.mmap"
+_MMAP_PREFIX = "vuer-"
 
 
 class Serializer(Protocol):
-    """Protocol for serializer implementations."""
+    """
+    Protocol for serializer implementations.
+
+    Tuples are encoded as arrays on the wire, exactly like lists, and
+    therefore decode as lists. Implementations should rely on their
+    backend's native tuple support rather than converting them up front.
+    """
 
     def encode(self, data: Any) -> bytes:
         """Encode data to bytes."""
@@ -23,61 +66,104 @@ class Serializer(Protocol):
         ...
 
 
-def _recursive_encode(data: Any, greedy: bool = True) -> Any:
-    """
-    Recursively encode data using ZData for special types.
+def _require_blosc2():
+    """Import and return blosc2, with an install hint if it is missing."""
+    if not BLOSC2_AVAILABLE:
+        raise ImportError(
+            "blosc2 is not installed. Install it with: "
+            "uv pip install 'vuer-rpc[compression]' or pip install blosc2"
+        )
+    import blosc2
+    return blosc2
 
-    Args:
-        data: Data to encode (can be nested)
-        greedy: If True, encode all ZData-supported types
 
-    Returns:
-        Encoded data with ZData wrappers where applicable
+def _compress_payload(zdata: dict, threshold: int) -> None:
     """
-    if not greedy:
-        return data
-
-    # Handle dictionaries recursively
-    if isinstance(data, dict):
-        return {k: _recursive_encode(v, greedy) for k, v in data.items()}
-
-    # Handle lists and tuples recursively
-    if isinstance(data, (list, tuple)):
-        encoded = [_recursive_encode(item, greedy) for item in data]
-        return encoded if isinstance(data, list) else tuple(encoded)
-
-    # Try to encode with ZData
-    return ZData.encode(data)
-
+    Compress a ZData payload in place with Blosc2/LZ4 if it is large enough.
 
-def _recursive_decode(data: Any, greedy: bool = True) -> Any:
+    The payload is left untouched if it is below the threshold, too large
+    for a single Blosc2 chunk, or does not actually shrink.
     """
-    Recursively decode data using ZData for encoded types.
-
-    Args:
-        data: Data to decode (can be nested)
-        greedy: If True, decode all ZData-encoded types
-
-    Returns:
-        Decoded data with ZData wrappers removed where applicable
+    blosc2 = _require_blosc2()
+    payload = memoryview(zdata["b"])
+    if not threshold <= payload.nbytes <= blosc2.MAX_BUFFERSIZE:
+        return
+
+    # Shuffling by element size is what makes numeric data compress well
+    try:
+        typesize = np.dtype(zdata.get("dtype") or "u1").itemsize
+    except TypeError:
+        typesize = 1
+
+    compressed = blosc2.compress2(
+        payload, typesize=min(typesize, 255), clevel=1, codec=blosc2.Codec.LZ4
+    )
+    if len(compressed) < payload.nbytes:
+        zdata["b"] = compressed
+        zdata["compression"] = "lz4"
+
+
+def _decompress_payload(zdata: dict) -> None:
+    """Undo _compress_payload in place."""
+    codec = zdata.pop("compression")
+    if codec not in _COMPRESSION_CODECS:
+        raise ValueError(f"Unknown ZData compression: {codec!r}")
+    if not BLOSC2_AVAILABLE:
+        raise ValueError(
+            f"ZData payload is compressed with {codec!r}, which needs blosc2. "
+            "Install it with: uv pip install 'vuer-rpc[compression]' or pip install blosc2"
+        )
+    import blosc2
+    zdata["b"] = blosc2.decompress2(zdata["b"])
+
+
+def _default_mmap_dir() -> str:
+    # /dev/shm is RAM backed, so the mapped file never touches the disk
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+def _mmap_payload(data: np.ndarray, directory: str) -> dict:
+    """Write an array to a new file in directory and return its descriptor."""
+    fd, path = tempfile.mkstemp(prefix=_MMAP_PREFIX, dir=directory)
+    try:
+        with open(fd, "wb") as f:
+            f.write(_byte_view(np.ascontiguousarray(data)))
+    except BaseException:
+        os.unlink(path)
+        raise
+    return {
+        "ztype": _MMAP_ZTYPE,
+        "path": path,
+        "dtype": _dtype_str(data.dtype),
+        "shape": data.shape,
+    }
+
+
+def _load_mmap(zdata: dict, directory: str) -> np.ndarray:
     """
-    if not greedy:
-        return data
-
-    # Handle ZData encoded objects
-    if ZData.is_zdata(data):
-        return ZData.decode(data)
-
-    # Handle dictionaries recursively
-    if isinstance(data, dict):
-        return {k: _recursive_decode(v, greedy) for k, v in data.items()}
-
-    # Handle lists and tuples recursively
-    if isinstance(data, (list, tuple)):
-        decoded = [_recursive_decode(item, greedy) for item in data]
-        return decoded if isinstance(data, list) else tuple(decoded)
+    Map the file written by _mmap_payload read-only and unlink it.
 
-    return data
+    Only files created by a serializer in the same directory are accepted, so
+    a message cannot make the receiver map arbitrary paths.
+    """
+    path = zdata["path"]
+    if (
+        os.path.dirname(os.path.realpath(path)) != directory
+        or not os.path.basename(path).startswith(_MMAP_PREFIX)
+    ):
+        raise ValueError(f"Refusing to map {path!r} outside {directory!r}")
+
+    array = np.memmap(
+        path, dtype=_get_dtype(zdata["dtype"]), mode="r", shape=tuple(zdata["shape"])
+    )
+    # The mapping outlives the directory entry, so the file is gone as soon as
+    # the array is released
+    try:
+        os.unlink(path)
+    except OSError:
+        # Windows cannot delete a file while it is mapped
+        pass
+    return array
 
 
 class MessagePackSerializer:
@@ -86,23 +172,122 @@ class MessagePackSerializer:
 
     Provides efficient binary encoding with optional recursive ZData encoding
     for numpy arrays, torch tensors, and PIL images.
+
+    Tuples are packed natively as msgpack arrays, exactly like lists, and
+    decode as lists; no per-tuple conversion happens on either side.
+
+    With ``greedy=False`` no Python code runs per object at all: the packer
+    has no default hook and the unpacker no object hook, so messages go
+    straight through msgpack's C implementation. Unsupported types such as
+    raw numpy arrays raise ``TypeError``; encode them with ZData first.
     """
 
-    def __init__(self, greedy: bool = True):
+    def __init__(
+        self,
+        greedy: bool = True,
+        compression: Optional[str] = None,
+        compression_threshold: int = 64 * 1024,
+        mmap_threshold: Optional[int] = None,
+        mmap_dir: Optional[str] = None,
+    ):
         """
         Initialize MessagePack serializer.
 
         Args:
             greedy: If True, recursively encode/decode ZData types
+            compression: Optional payload codec; "lz4" compresses large ZData
+                payloads with Blosc2 (requires the blosc2 package). Only the
+                sender needs it: any greedy serializer decompresses received
+                payloads, provided blosc2 is installed.
+            compression_threshold: Minimum payload size in bytes to compress
+            mmap_threshold: If set, numpy arrays of at least this many bytes
+                are written to a file in mmap_dir and only a small descriptor
+                is packed into the message. The receiver maps the file instead
+                of copying the data. Only for producers and consumers sharing
+                a filesystem (e.g. IPC on one host); both ends must enable it.
+                Each file is deleted when the message is decoded, so every
+                message must be decoded exactly once.
+            mmap_dir: Directory for memory-mapped payloads; defaults to
+                /dev/shm where available and the temp directory otherwise
         """
+        if compression is not None:
+            if compression not in _COMPRESSION_CODECS:
+                raise ValueError(f"Unsupported compression: {compression!r}")
+            _require_blosc2()
+
         self.greedy = greedy
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.mmap_threshold = mmap_threshold
+        self.mmap_dir = os.path.realpath(mmap_dir or _default_mmap_dir())
+        # Reused across calls so its internal buffer is not reallocated for
+        # every message. ZData types are encoded by the default hook if greedy.
+        self._packer = self._new_packer()
+        self._lock = threading.Lock()
+        # Thread running the encode call in progress, to detect re-entry
+        self._owner: Optional[int] = None
+        # Out-of-band buffer list of the encode call in progress, if any
+        self._buffers: Optional[list[memoryview]] = None
+        # Memory-mapped files written by the encode call in progress
+        self._mmap_files: list[str] = []
+
+    def _new_packer(self) -> msgpack.Packer:
+        return msgpack.Packer(
+            use_bin_type=True,
+            autoreset=False,
+            default=self._default if self.greedy else None,
+        )
+
+    def _default(self, obj: Any) -> Any:
+        """
+        msgpack ``default`` hook that encodes non-native leaves with ZData.
 
-    def encode(self, data: Any) -> bytes:
+        msgpack only calls this for objects it cannot pack itself, so plain
+        dicts, lists and primitives never leave the C packer. Payloads are
+        compressed, moved out of band or memory-mapped if requested.
+        """
+        threshold = self.mmap_threshold
+        if (
+            threshold is not None
+            and isinstance(obj, np.ndarray)
+            and obj.nbytes
+            and obj.nbytes >= threshold
+        ):
+            _check_plain_array(obj)
+            encoded = _mmap_payload(obj, self.mmap_dir)
+            self._mmap_files.append(encoded["path"])
+            return encoded
+
+        encoded = TYPE_REGISTRY.encode(obj)
+        if encoded is obj:
+            raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+        if self.compression is None and self._buffers is None:
+            return encoded
+        if not isinstance(encoded, dict) or "b" not in encoded:
+            return encoded
+
+        if self.compression is not None:
+            _compress_payload(encoded, self.compression_threshold)
+
+        buffers = self._buffers
+        if buffers is not None:
+            encoded["buf_idx"] = len(buffers)
+            buffers.append(memoryview(encoded.pop("b")))
+        return encoded
+
+    def encode(self, data: Any, buffers: Optional[list[memoryview]] = None) -> bytes:
         """
         Encode data to MessagePack binary format.
 
         Args:
             data: Data to encode (dicts, lists, primitives, ZData types)
+            buffers: Optional list that receives ZData payloads out of band.
+                When given, each ZData ``"b"`` field is appended to this list
+                instead of being copied into the message, and replaced by a
+                ``"buf_idx"`` index. The transport is expected to send the
+                buffers alongside the message (e.g. as extra frames) and pass
+                them back to ``decode``. Only applies in greedy mode.
 
         Returns:
             MessagePack encoded bytes
@@ -114,20 +299,88 @@ class MessagePackSerializer:
             >>> encoded = serializer.encode(data)
             >>> isinstance(encoded, bytes)
             True
-        """
-        # Recursively encode ZData types if greedy
-        if self.greedy:
-            data = _recursive_encode(data, greedy=True)
-
-        # Pack to MessagePack
-        return msgpack.packb(data, use_bin_type=True)
 
-    def decode(self, data: bytes) -> Any:
+            >>> buffers = []
+            >>> encoded = serializer.encode(data, buffers=buffers)
+            >>> decoded = serializer.decode(encoded, buffers=buffers)
+        """
+        if self._owner == threading.get_ident():
+            # Called again from a hook of the encode in progress (e.g. a custom
+            # encoder packing its payload), which holds the lock and the Packer
+            return self._encode_once(data, buffers)
+
+        with self._lock:
+            self._owner = threading.get_ident()
+            self._buffers = buffers
+            self._mmap_files = []
+            packer = self._packer
+            try:
+                packer.pack(data)
+                encoded = packer.bytes()
+            except BaseException:
+                # The partial message may have grown the buffer arbitrarily
+                self._packer = self._new_packer()
+                self._discard_mmap_files()
+                raise
+            finally:
+                packer.reset()
+                self._buffers = None
+                self._mmap_files = []
+                self._owner = None
+
+            if len(encoded) > _PACKER_BUFFER_MAX:
+                self._packer = self._new_packer()
+            return encoded
+
+    def _encode_once(self, data: Any, buffers: Optional[list[memoryview]]) -> bytes:
+        """Encode with a one-off packer, keeping the outer call's state."""
+        outer_buffers, outer_files = self._buffers, self._mmap_files
+        self._buffers, self._mmap_files = buffers, []
+        try:
+            encoded = msgpack.packb(
+                data,
+                use_bin_type=True,
+                default=self._default if self.greedy else None,
+            )
+        except BaseException:
+            self._discard_mmap_files()
+            raise
+        finally:
+            inner_files = self._mmap_files
+            self._buffers, self._mmap_files = outer_buffers, outer_files
+        # The files now belong to the outer message
+        outer_files.extend(inner_files)
+        return encoded
+
+    def _discard_mmap_files(self) -> None:
+        """Delete the files written for a message that failed to encode."""
+        for path in self._mmap_files:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._mmap_files = []
+
+    def decode(
+        self,
+        data: Union[bytes, bytearray, memoryview],
+        buffers: Optional[list] = None,
+    ) -> Any:
         """
         Decode MessagePack binary to Python objects.
 
         Args:
-            data: MessagePack encoded bytes
+            data: MessagePack encoded bytes, or any buffer over them (e.g. a
+                memoryview into a receive buffer)
+            buffers: Out-of-band buffers produced by ``encode(..., buffers=...)``.
+                Decoded arrays alias these buffers, so they must stay alive
+                (and unmodified) for as long as the decoded objects are used.
+
+        Note:
+            msgpack copies in-band ``b`` payloads out of ``data`` into new
+            ``bytes`` objects. To receive large arrays without that copy, send
+            them out of band: arrays decoded from ``buffers`` are views over
+            the caller's memory (writable if the buffers are).
 
         Returns:
             Decoded Python object with ZData types restored
@@ -138,14 +391,52 @@ class MessagePackSerializer:
             >>> isinstance(decoded["array"], np.ndarray)
             True
         """
-        # Unpack from MessagePack
-        unpacked = msgpack.unpackb(data, raw=False)
-
-        # Recursively decode ZData types if greedy
-        if self.greedy:
-            unpacked = _recursive_decode(unpacked, greedy=True)
-
-        return unpacked
+        # ZData dicts are decoded by msgpack's object hook if greedy. Messages
+        # that cannot contain a ztype key need no hook, and every map stays
+        # in msgpack's C unpacker.
+        object_hook = None
+        searchable = isinstance(data, (bytes, bytearray))
+        if self.greedy and (not searchable or b"ztype" in data):
+            # Compressed payloads are decoded whatever this side's settings
+            plain = (
+                buffers is None
+                and self.mmap_threshold is None
+                and searchable
+                and b"compression" not in data
+            )
+            if plain:
+                object_hook = TYPE_REGISTRY.decode
+            else:
+                mmap_dir = self.mmap_dir if self.mmap_threshold is not None else None
+
+                def object_hook(obj: dict) -> Any:
+                    # User maps may use the same keys; only ZData maps carry
+                    # payload references, compression or mmap descriptors
+                    ztype = obj.get("ztype")
+                    if ztype is None:
+                        return obj
+                    if mmap_dir is not None and ztype == _MMAP_ZTYPE:
+                        return _load_mmap(obj, mmap_dir)
+                    if buffers is not None and "buf_idx" in obj:
+                        obj["b"] = buffers[obj.pop("buf_idx")]
+                    if "compression" in obj:
+                        _decompress_payload(obj)
+                    return TYPE_REGISTRY.decode(obj)
+
+        return msgpack.unpackb(data, raw=False, object_hook=object_hook)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether a message tree holds a NaN or infinite float."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, np.floating):
+        return not np.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
 
 
 class JSONSerializer:
@@ -153,7 +444,16 @@ class JSONSerializer:
     JSON serializer with ZData support.
 
     Provides text-based encoding with optional ZData support.
-    Note: Binary data in ZData will be base64 encoded.
+    Uses orjson when it is installed, and the stdlib json module otherwise.
+    Payloads orjson cannot round-trip (NaN or infinite floats, integers
+    beyond 64 bits) are handled by the stdlib, so both backends produce the
+    same result.
+    Note: Binary data in ZData will be base64 encoded, except for numeric
+    numpy arrays, which are written as flat lists of numbers.
+
+    The tree walk is left to the JSON backend: leaves it cannot serialize
+    are passed to a ``default`` hook, and ZData/bytes markers are restored by
+    an ``object_hook`` while parsing.
     """
 
     def __init__(self, greedy: bool = True):
@@ -178,14 +478,19 @@ class JSONSerializer:
         Note:
             Binary data in ZData objects will be base64 encoded for JSON compatibility.
         """
-        # Recursively encode ZData types if greedy
-        if self.greedy:
-            data = _recursive_encode(data, greedy=True)
-
-        # Convert bytes to base64 for JSON compatibility
-        data = self._bytes_to_base64(data)
-
-        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+        if ORJSON_AVAILABLE:
+            try:
+                encoded = orjson.dumps(
+                    data, default=self._orjson_default, option=orjson.OPT_NON_STR_KEYS
+                )
+            except orjson.JSONEncodeError:
+                # Integers beyond 64 bits (other errors are raised again below)
+                pass
+            else:
+                # orjson writes NaN and infinity as null
+                if b"null" not in encoded or not _has_non_finite(data):
+                    return encoded
+        return json.dumps(data, default=self._default, separators=(',', ':')).encode('utf-8')
 
     def decode(self, data: bytes) -> Any:
         """
@@ -197,49 +502,127 @@ class JSONSerializer:
         Returns:
             Decoded Python object with ZData types restored
         """
-        # Decode JSON
-        unpacked = json.loads(data.decode('utf-8'))
+        # Payloads without bytes or ZData markers need no object hook
+        has_bytes = b'"__bytes__"' in data
+        if not has_bytes and not (self.greedy and b'"ztype"' in data):
+            if ORJSON_AVAILABLE and _LONG_DIGIT_RUN.search(data) is None:
+                try:
+                    return orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    # NaN and Infinity tokens; invalid JSON fails again below
+                    pass
+            return json.loads(data)
+
+        # With ZData markers only, the registry itself is the hook
+        object_hook = self._object_hook if has_bytes else TYPE_REGISTRY.decode
+        return json.loads(data, object_hook=object_hook)
+
+    def _orjson_default(self, obj: Any) -> Any:
+        """orjson ``default`` hook, rendering number lists natively."""
+        return self._default(obj, native_numpy=True)
+
+    def _default(self, obj: Any, native_numpy: bool = False) -> Any:
+        """JSON ``default`` hook for leaves the backend cannot serialize itself."""
+        # Convert bytes to base64 for JSON compatibility
+        if isinstance(obj, (bytes, bytearray, memoryview)):
+            return {"__bytes__": base64.b64encode(obj).decode('ascii')}
 
-        # Convert base64 back to bytes
-        unpacked = self._base64_to_bytes(unpacked)
+        if self.greedy:
+            # Numeric arrays go out as number lists rather than base64 bytes
+            if type(obj) is np.ndarray:
+                encoded = _encode_numpy_json(obj)
+                if encoded is not None:
+                    flat = encoded["data"]
+                    if native_numpy:
+                        # Pre-rendered by orjson's native numpy writer
+                        encoded["data"] = orjson.Fragment(
+                            orjson.dumps(flat, option=orjson.OPT_SERIALIZE_NUMPY)
+                        )
+                    else:
+                        encoded["data"] = flat.tolist()
+                    return encoded
+
+            encoded = TYPE_REGISTRY.encode(obj)
+            if encoded is not obj:
+                return encoded
+
+        # numpy scalars (e.g. np.int64) are written as plain numbers
+        if isinstance(obj, np.generic):
+            return obj.item()
+
+        raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+    def _object_hook(self, obj: dict) -> Any:
+        """JSON ``object_hook`` restoring bytes and, if greedy, ZData types."""
+        # Check for our bytes marker
+        if "__bytes__" in obj and len(obj) == 1:
+            return base64.b64decode(obj["__bytes__"])
 
-        # Recursively decode ZData types if greedy
         if self.greedy:
-            unpacked = _recursive_decode(unpacked, greedy=True)
+            return TYPE_REGISTRY.decode(obj)
+
+        return obj
+
+
+class PickleSerializer:
+    """
+    Pickle (protocol 5) serializer for trusted, Python-only peers.
+
+    Any picklable object is supported natively, numpy arrays included, so no
+    ZData encoding is involved. With a ``buffers`` list, array payloads are
+    handed over out of band without being copied into the message, which
+    suits local transports (e.g. zmq IPC) that send them as separate frames.
 
-        return unpacked
+    Warning:
+        Unpickling can execute arbitrary code. Only decode messages from
+        processes you trust; use MessagePackSerializer for anything else,
+        including peers written in other languages.
+    """
 
-    def _bytes_to_base64(self, data: Any) -> Any:
-        """Convert bytes to base64 strings recursively for JSON compatibility."""
-        import base64
+    def encode(self, data: Any, buffers: Optional[list[memoryview]] = None) -> bytes:
+        """
+        Encode data with pickle protocol 5.
 
-        if isinstance(data, bytes):
-            return {"__bytes__": base64.b64encode(data).decode('ascii')}
+        Args:
+            data: Any picklable object
+            buffers: Optional list that receives out-of-band payloads (flat
+                memoryviews over e.g. numpy array memory) instead of copying
+                them into the message. Pass them back to ``decode``.
 
-        if isinstance(data, dict):
-            return {k: self._bytes_to_base64(v) for k, v in data.items()}
+        Returns:
+            Pickled bytes
 
-        if isinstance(data, (list, tuple)):
-            converted = [self._bytes_to_base64(item) for item in data]
-            return converted if isinstance(data, list) else tuple(converted)
+        Example:
+            >>> serializer = PickleSerializer()
+            >>> buffers = []
+            >>> encoded = serializer.encode({"array": np.zeros(1024)}, buffers=buffers)
+            >>> decoded = serializer.decode(encoded, buffers=buffers)
+        """
+        if buffers is None:
+            return pickle.dumps(data, protocol=5)
 
-        return data
+        def buffer_callback(buffer: pickle.PickleBuffer) -> None:
+            buffers.append(buffer.raw())
 
-    def _base64_to_bytes(self, data: Any) -> Any:
-        """Convert base64 strings back to bytes recursively."""
-        import base64
+        return pickle.dumps(data, protocol=5, buffer_callback=buffer_callback)
 
-        if isinstance(data, dict):
-            # Check for our bytes marker
-            if "__bytes__" in data and len(data) == 1:
-                return base64.b64decode(data["__bytes__"])
-            return {k: self._base64_to_bytes(v) for k, v in data.items()}
+    def decode(
+        self,
+        data: Union[bytes, bytearray, memoryview],
+        buffers: Optional[list] = None,
+    ) -> Any:
+        """
+        Decode pickled data.
 
-        if isinstance(data, (list, tuple)):
-            converted = [self._base64_to_bytes(item) for item in data]
-            return converted if isinstance(data, list) else tuple(converted)
+        Args:
+            data: Bytes produced by ``encode``
+            buffers: Out-of-band buffers produced by ``encode(..., buffers=...)``.
+                Decoded arrays alias these buffers (read-only if they are).
 
-        return data
+        Returns:
+            Decoded Python object
+        """
+        return pickle.loads(data, buffers=buffers)
 
 
 # Default serializer instances
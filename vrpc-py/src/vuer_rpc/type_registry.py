@@ -5,16 +5,21 @@ Provides a global registry that can be extended by users to add custom types.
 This module can be imported and extended in user code or third-party libraries.
 """
 
-from typing import Any, Callable, Dict, Optional, Protocol
+import struct
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol, Sequence, Union
 from typing_extensions import TypedDict
 
 
 class ZDataDict(TypedDict, total=False):
     """Type definition for ZData encoded objects."""
     ztype: str
-    b: bytes
+    b: Union[bytes, memoryview]
     dtype: Optional[str]
     shape: Optional[tuple]
+    data: Optional[Any]
+    shapes: Optional[list[tuple]]
+    offsets: Optional[list[int]]
 
 
 class TypeEncoder(Protocol):
@@ -31,6 +36,18 @@ class TypeDecoder(Protocol):
         ...
 
 
+# Builtin types that have no encoder unless one is registered explicitly.
+# They are checked first so primitive leaves skip the encoder lookup entirely.
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+# Soft cap on memoized checker matches, so code that creates many ad-hoc
+# classes cannot grow the cache without bound
+_CHECKER_CACHE_SIZE = 256
+
+# Checker cache marker for types that have not been through the checkers yet
+_UNRESOLVED = object()
+
+
 class TypeRegistry:
     """
     Registry for custom type encoders and decoders.
@@ -45,7 +62,15 @@ class TypeRegistry:
     def __init__(self):
         self._encoders: Dict[type, tuple[str, TypeEncoder]] = {}
         self._decoders: Dict[str, TypeDecoder] = {}
-        self._type_checkers: list[tuple[Callable[[Any], bool], str, TypeEncoder]] = []
+        # (checker, type_name, encoder, cache_by_type)
+        self._type_checkers: list[tuple[Callable[[Any], bool], str, TypeEncoder, bool]] = []
+        # Type classes registered with include_subclasses
+        self._subclass_encoders: Dict[type, tuple[str, TypeEncoder]] = {}
+        # Primitive types that bypass encoder lookup (minus any registered ones)
+        self._passthrough: frozenset[type] = _PASSTHROUGH_TYPES
+        # Concrete types resolved through cacheable type checkers or base
+        # classes (None if unclaimed)
+        self._checker_cache: Dict[type, Optional[tuple[str, TypeEncoder]]] = {}
 
     def register(
         self,
@@ -53,7 +78,9 @@ class TypeRegistry:
         encoder: TypeEncoder,
         decoder: TypeDecoder,
         type_class: Optional[type] = None,
-        type_checker: Optional[Callable[[Any], bool]] = None
+        type_checker: Optional[Callable[[Any], bool]] = None,
+        cache_by_type: bool = False,
+        include_subclasses: bool = False,
     ):
         """
         Register a type for encoding/decoding.
@@ -62,15 +89,30 @@ class TypeRegistry:
             type_name: Unique identifier for this type (e.g., "numpy.ndarray")
             encoder: Function that encodes data to ZDataDict
             decoder: Function that decodes ZDataDict back to original type
-            type_class: Optional type class for direct type checking
-            type_checker: Optional function for custom type checking
+            type_class: Optional type class for direct type checking.
+                Subclasses of native types (str, int, float, bytes, dict, list, tuple) are packed
+                as the plain native type by MessagePackSerializer (and the
+                stdlib json backend of JSONSerializer), which handle them
+                without calling the registry; such types only round-trip
+                through ZData.encode/decode directly.
+            type_checker: Optional function for custom type checking. It is
+                called for every object not resolved by type class.
+                Checkers are not consulted for str, int, float, bool, bytes
+                and None.
+            cache_by_type: Set if type_checker decides based on the type of
+                its argument only (not instance state). Its outcome (match or
+                no match) is then memoized per concrete type, so it runs once
+                per type instead of once per object.
+            include_subclasses: Also encode subclasses of type_class with
+                this encoder, for subclasses that carry no extra state (e.g.
+                np.memmap). Type checkers are consulted first, so a checker
+                registered for a specific subclass still takes precedence.
 
         Example:
             >>> def encode_point(p):
-            ...     return {"ztype": "custom.Point", "b": f"{p.x},{p.y}".encode()}
+            ...     return {"ztype": "custom.Point", "b": struct.pack("<2d", p.x, p.y)}
             >>> def decode_point(z):
-            ...     x, y = map(float, z["b"].decode().split(","))
-            ...     return Point(x, y)
+            ...     return Point(*struct.unpack("<2d", z["b"]))
             >>> TYPE_REGISTRY.register(
             ...     "custom.Point",
             ...     encode_point,
@@ -78,16 +120,56 @@ class TypeRegistry:
             ...     type_class=Point
             ... )
         """
-        # Register decoder
-        self._decoders[type_name] = decoder
+        self.register_many(
+            [(
+                type_name, encoder, decoder,
+                type_class, type_checker, cache_by_type, include_subclasses,
+            )]
+        )
 
-        # Register encoder by type class
-        if type_class is not None:
-            self._encoders[type_class] = (type_name, encoder)
+    def register_many(self, entries: Iterable[tuple]):
+        """
+        Register several types at once.
+
+        Each entry is a tuple of ``register`` arguments:
+        ``(type_name, encoder, decoder[, type_class[, type_checker[,
+        cache_by_type[, include_subclasses]]]])``.
+        The dispatch caches are invalidated once for the whole batch.
+
+        Example:
+            >>> TYPE_REGISTRY.register_many([
+            ...     ("custom.Point", encode_point, decode_point, Point),
+            ...     ("custom.Shape", encode_shape, decode_shape, None, is_shape),
+            ... ])
+        """
+        registered_classes = set()
+        for type_name, encoder, decoder, *rest in entries:
+            type_class, type_checker, cache_by_type, include_subclasses = (
+                *rest, None, None, False, False
+            )[:4]
 
-        # Register encoder by type checker
-        if type_checker is not None:
-            self._type_checkers.append((type_checker, type_name, encoder))
+            # Register decoder
+            self._decoders[type_name] = decoder
+
+            # Register encoder by type class
+            if type_class is not None:
+                self._encoders[type_class] = (type_name, encoder)
+                registered_classes.add(type_class)
+                if include_subclasses:
+                    self._subclass_encoders[type_class] = (type_name, encoder)
+                else:
+                    self._subclass_encoders.pop(type_class, None)
+
+            # Register encoder by type checker
+            if type_checker is not None:
+                self._type_checkers.append(
+                    (type_checker, type_name, encoder, bool(cache_by_type))
+                )
+
+        if registered_classes:
+            self._passthrough = self._passthrough - registered_classes
+        # New registrations may change how already-seen types resolve
+        self._checker_cache.clear()
 
     def encode(self, data: Any) -> Any:
         """
@@ -96,19 +178,56 @@ class TypeRegistry:
         Returns the encoded ZDataDict if a matching encoder is found,
         otherwise returns the data unchanged.
         """
-        # Check by exact type
         data_type = type(data)
-        if data_type in self._encoders:
-            type_name, encoder = self._encoders[data_type]
-            return encoder(data)
+        if data_type in self._passthrough:
+            return data
+
+        # Check by exact type, then by types already resolved through checkers
+        # or base classes
+        entry = self._encoders.get(data_type)
+        if entry is None:
+            entry = self._checker_cache.get(data_type, _UNRESOLVED)
+            if entry is _UNRESOLVED:
+                entry = self._resolve_checker(data)
+            if entry is None:
+                # No encoder found, return as-is
+                return data
 
-        # Check using custom type checkers
-        for checker, type_name, encoder in self._type_checkers:
+        return entry[1](data)
+
+    def _resolve_checker(self, data: Any) -> Optional[tuple[str, TypeEncoder]]:
+        """Resolve an encoder for data's type, memoizing type-based outcomes."""
+        data_type = type(data)
+        # An outcome may only be reused if every checker consulted for it
+        # decides by type; instance-based ones (e.g. on dict contents) may
+        # answer differently for the next object of the same type
+        cacheable = True
+        for checker, type_name, encoder, cache_by_type in self._type_checkers:
+            cacheable = cacheable and cache_by_type
             if checker(data):
-                return encoder(data)
+                entry = (type_name, encoder)
+                if cacheable:
+                    self._memoize(data_type, entry)
+                return entry
+
+        # Subclasses of a type class registered with include_subclasses
+        # (e.g. np.memmap) use its encoder
+        entry = None
+        if self._subclass_encoders:
+            for base in data_type.__mro__[1:]:
+                entry = self._subclass_encoders.get(base)
+                if entry is not None:
+                    break
+
+        # Misses are memoized too, so unclaimed types skip the checkers next time
+        if cacheable:
+            self._memoize(data_type, entry)
+        return entry
 
-        # No encoder found, return as-is
-        return data
+    def _memoize(self, data_type: type, entry: Optional[tuple[str, TypeEncoder]]):
+        if len(self._checker_cache) >= _CHECKER_CACHE_SIZE:
+            self._checker_cache.clear()
+        self._checker_cache[data_type] = entry
 
     def decode(self, zdata: Any) -> Any:
         """
@@ -117,14 +236,17 @@ class TypeRegistry:
         Returns the decoded object if zdata is a valid ZData dict,
         otherwise returns the data unchanged.
         """
-        if not isinstance(zdata, dict) or "ztype" not in zdata:
+        if not isinstance(zdata, dict):
             return zdata
 
-        ztype = zdata["ztype"]
-        if ztype not in self._decoders:
-            raise TypeError(f"Unknown ZData type: {ztype}")
+        # Single key probe instead of a membership test plus a lookup
+        ztype = zdata.get("ztype")
+        if ztype is None:
+            return zdata
 
-        decoder = self._decoders[ztype]
+        decoder = self._decoders.get(ztype)
+        if decoder is None:
+            raise TypeError(f"Unknown ZData type: {ztype}")
         return decoder(zdata)
 
     def is_zdata(self, data: Any) -> bool:
@@ -141,6 +263,61 @@ class TypeRegistry:
         """List all registered type names."""
         return list(self._decoders.keys())
 
+    def has_type(self, type_name: str) -> bool:
+        """Check whether a type name is registered."""
+        return type_name in self._decoders
+
 
 # Global type registry - users can extend this
 TYPE_REGISTRY = TypeRegistry()
+
+
+def struct_codec(
+    type_name: str,
+    fmt: str,
+    type_class: type,
+    fields: Sequence[str],
+) -> tuple[TypeEncoder, TypeDecoder]:
+    """
+    Build an encoder/decoder pair packing fixed numeric fields with struct.
+
+    The format is compiled once into a ``struct.Struct`` and the fields are
+    read with ``operator.attrgetter``, so both directions run in C. Binary
+    packing is several times faster than formatting and parsing text.
+
+    Args:
+        type_name: ztype of the records (e.g. "custom.Point")
+        fmt: struct format for the fields, e.g. "<2d"; use an explicit byte
+            order so the payload is portable
+        type_class: Class to rebuild, called with the unpacked fields in order
+        fields: Attribute names to pack, in format order
+
+    Returns:
+        (encoder, decoder) tuple, ready to pass to ``register``
+
+    Example:
+        >>> encode_point, decode_point = struct_codec(
+        ...     "custom.Point", "<2d", Point, ("x", "y")
+        ... )
+        >>> TYPE_REGISTRY.register(
+        ...     "custom.Point", encode_point, decode_point, type_class=Point
+        ... )
+    """
+    packer = struct.Struct(fmt)
+    pack, unpack = packer.pack, packer.unpack
+    if len(fields) == 1:
+        # attrgetter returns a bare value rather than a tuple for one name
+        getter = attrgetter(fields[0])
+
+        def encode(data: Any) -> ZDataDict:
+            return {"ztype": type_name, "b": pack(getter(data))}
+    else:
+        getter = attrgetter(*fields)
+
+        def encode(data: Any) -> ZDataDict:
+            return {"ztype": type_name, "b": pack(*getter(data))}
+
+    def decode(zdata: ZDataDict) -> Any:
+        return type_class(*unpack(zdata["b"]))
+
+    return encode, decode
@@ -5,10 +5,17 @@ Defines the core message structures used for communication between
 clients and servers in the Vuer ecosystem.
 """
 
-from typing import Any, Optional, TypedDict, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, TypedDict, Union
 from typing_extensions import NotRequired
 import time
 
+_time_ns = time.time_ns
+
+# Timestamp shared by all events created inside an event_batch() block
+_BATCH_TS: ContextVar[Optional[int]] = ContextVar("vuer_rpc_batch_ts", default=None)
+
 
 class Message(TypedDict, total=False):
     """
@@ -96,8 +103,45 @@ EventType = Union[Message, ClientEvent, ServerEvent, RPCRequest, RPCResponse]
 
 
 def current_timestamp() -> int:
-    """Get current timestamp in milliseconds."""
-    return int(time.time() * 1000)
+    """
+    Get current timestamp in milliseconds (wall clock, Unix epoch).
+
+    Inside an ``event_batch()`` block this is the batch timestamp instead.
+    """
+    ts = _BATCH_TS.get()
+    if ts is not None:
+        return ts
+    return _time_ns() // 1_000_000
+
+
+@contextmanager
+def event_batch(ts: Optional[int] = None) -> Iterator[int]:
+    """
+    Give every event created inside the block the same timestamp.
+
+    The clock is read once on entry instead of once per event, which also
+    stamps a burst of related events (e.g. one frame's updates) identically.
+    Blocks nest, and the timestamp is scoped per thread and asyncio task.
+
+    Args:
+        ts: Optional timestamp for the batch (defaults to current time)
+
+    Yields:
+        The batch timestamp
+
+    Example:
+        >>> with event_batch() as ts:
+        ...     events = [add_event(nodes), update_event(changes)]
+        >>> all(e["ts"] == ts for e in events)
+        True
+    """
+    if ts is None:
+        ts = _time_ns() // 1_000_000
+    token = _BATCH_TS.set(ts)
+    try:
+        yield ts
+    finally:
+        _BATCH_TS.reset(token)
 
 
 def create_client_event(
@@ -121,7 +165,7 @@ def create_client_event(
         ClientEvent dictionary
     """
     event: ClientEvent = {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": etype,
     }
     if value is not None:
@@ -150,7 +194,7 @@ def create_server_event(
         ServerEvent dictionary
     """
     return {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": etype,
         "data": data,
     }
@@ -179,7 +223,7 @@ def create_rpc_request(
         RPCRequest dictionary
     """
     request: RPCRequest = {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": etype,
         "rtype": rtype,
     }
@@ -215,7 +259,7 @@ def create_rpc_response(
         RPCResponse dictionary
     """
     response: RPCResponse = {
-        "ts": ts or current_timestamp(),
+        "ts": ts if ts is not None else current_timestamp(),
         "etype": etype,
         "ok": ok,
         "error": error,
@@ -18,14 +18,20 @@ With optional extensions:
     >>> encoded = ZData.encode(tensor)
 
 Custom types:
+    >>> import struct
     >>> class Point:
     ...     def __init__(self, x, y): self.x, self.y = x, y
     >>> def encode_point(p):
-    ...     return {"ztype": "custom.Point", "b": f"{p.x},{p.y}".encode()}
+    ...     return {"ztype": "custom.Point", "b": struct.pack("<2d", p.x, p.y)}
     >>> def decode_point(z):
-    ...     x, y = map(float, z["b"].decode().split(","))
-    ...     return Point(x, y)
+    ...     return Point(*struct.unpack("<2d", z["b"]))
     >>> ZData.register_type("custom.Point", encode_point, decode_point, Point)
+
+The same operations are available as module-level functions bound straight
+to the registry, which skip the ZData class attribute lookup and the extra
+call frame on hot paths:
+    >>> from vmp_py import zdata
+    >>> decoded = zdata.decode(zdata.encode(arr))
 """
 
 from typing import Any, Callable, Optional
@@ -33,6 +39,7 @@ from .type_registry import TYPE_REGISTRY, ZDataDict, TypeEncoder, TypeDecoder
 
 # Import built-in types (numpy is always available)
 from . import builtin_types  # noqa: F401
+from .builtin_types import encode_numpy_batch
 
 
 class ZData:
@@ -51,12 +58,13 @@ class ZData:
         >>> decoded = ZData.decode(encoded)
 
         >>> # Register custom type
+        >>> import struct
         >>> class Point:
         ...     def __init__(self, x, y): self.x, self.y = x, y
         >>> ZData.register_type(
         ...     "custom.Point",
-        ...     lambda p: {"ztype": "custom.Point", "b": f"{p.x},{p.y}".encode()},
-        ...     lambda z: Point(*map(float, z["b"].decode().split(","))),
+        ...     lambda p: {"ztype": "custom.Point", "b": struct.pack("<2d", p.x, p.y)},
+        ...     lambda z: Point(*struct.unpack("<2d", z["b"])),
         ...     type_class=Point
         ... )
     """
@@ -103,6 +111,32 @@ class ZData:
         """
         return TYPE_REGISTRY.decode(zdata)
 
+    @staticmethod
+    def encode_batch(arrays: list) -> ZDataDict:
+        """
+        Encode a list of same-dtype numpy arrays as one ZData record.
+
+        The arrays share a single contiguous payload, which avoids per-array
+        header overhead when sending many small arrays. Decoding returns a
+        list of arrays (views into one buffer) in the original order.
+
+        Args:
+            arrays: Non-empty list of numpy arrays with a common dtype
+
+        Returns:
+            ZDataDict with ztype "numpy.ndarray.batch"
+
+        Raises:
+            ValueError: If arrays is empty
+            TypeError: If the arrays do not share a dtype
+
+        Example:
+            >>> batch = ZData.encode_batch([np.zeros(3), np.ones((2, 2))])
+            >>> [a.shape for a in ZData.decode(batch)]
+            [(3,), (2, 2)]
+        """
+        return encode_numpy_batch(arrays)
+
     @staticmethod
     def is_zdata(data: Any) -> bool:
         """
@@ -148,7 +182,9 @@ class ZData:
         encoder: TypeEncoder,
         decoder: TypeDecoder,
         type_class: Optional[type] = None,
-        type_checker: Optional[Callable[[Any], bool]] = None
+        type_checker: Optional[Callable[[Any], bool]] = None,
+        cache_by_type: bool = False,
+        include_subclasses: bool = False,
     ):
         """
         Register a custom type for encoding/decoding.
@@ -159,24 +195,30 @@ class ZData:
             decoder: Function that decodes ZDataDict back to original type
             type_class: Optional type class for direct type checking
             type_checker: Optional function for custom type checking
+            cache_by_type: Memoize type_checker outcomes per concrete type;
+                only for checkers that ignore instance state
+            include_subclasses: Also encode subclasses of type_class
 
         Example:
+            >>> import struct
             >>> class Point:
             ...     def __init__(self, x, y): self.x, self.y = x, y
             ...
             >>> def encode_point(p):
-            ...     return {"ztype": "custom.Point", "b": f"{p.x},{p.y}".encode()}
+            ...     return {"ztype": "custom.Point", "b": struct.pack("<2d", p.x, p.y)}
             ...
             >>> def decode_point(z):
-            ...     x, y = map(float, z["b"].decode().split(","))
-            ...     return Point(x, y)
+            ...     return Point(*struct.unpack("<2d", z["b"]))
             ...
             >>> ZData.register_type("custom.Point", encode_point, decode_point, Point)
             >>> point = Point(1.0, 2.0)
             >>> encoded = ZData.encode(point)
             >>> decoded = ZData.decode(encoded)
         """
-        TYPE_REGISTRY.register(type_name, encoder, decoder, type_class, type_checker)
+        TYPE_REGISTRY.register(
+            type_name, encoder, decoder,
+            type_class, type_checker, cache_by_type, include_subclasses,
+        )
 
     @staticmethod
     def list_types() -> list[str]:
@@ -191,3 +233,28 @@ class ZData:
             ['numpy.ndarray', 'torch.Tensor', ...]
         """
         return TYPE_REGISTRY.list_registered_types()
+
+    @staticmethod
+    def has_type(type_name: str) -> bool:
+        """
+        Check whether a ztype is registered.
+
+        Prefer this over ``type_name in ZData.list_types()``, which builds a
+        new list on every call.
+
+        Example:
+            >>> ZData.has_type("numpy.ndarray")
+            True
+        """
+        return TYPE_REGISTRY.has_type(type_name)
+
+
+# Module-level aliases of the ZData methods, bound directly to the registry
+encode = TYPE_REGISTRY.encode
+decode = TYPE_REGISTRY.decode
+encode_batch = encode_numpy_batch
+is_zdata = TYPE_REGISTRY.is_zdata
+get_ztype = TYPE_REGISTRY.get_ztype
+register_type = TYPE_REGISTRY.register
+list_types = TYPE_REGISTRY.list_registered_types
+has_type = TYPE_REGISTRY.has_type
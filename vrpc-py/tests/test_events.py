@@ -10,6 +10,8 @@ from vuer_rpc import (
     upsert_event,
     remove_event,
     timeout_event,
+    event_batch,
+    current_timestamp,
 )
 
 
@@ -118,3 +120,37 @@ def test_event_timestamps():
     for event in events:
         assert "ts" in event
         assert before <= event["ts"] <= after
+
+
+def test_explicit_zero_timestamp():
+    """Test that an explicit ts=0 is kept rather than replaced."""
+    events = [
+        set_event({"tag": "scene"}, ts=0),
+        add_event([], ts=0),
+        update_event([], ts=0),
+        upsert_event([], ts=0),
+        remove_event([], ts=0),
+        timeout_event(1.0, "fn", ts=0),
+    ]
+
+    for event in events:
+        assert event["ts"] == 0
+
+
+def test_event_batch_shares_timestamp():
+    """Test that events inside event_batch() share one timestamp."""
+    with event_batch() as ts:
+        events = [
+            set_event({"tag": "scene"}),
+            add_event([]),
+            update_event([]),
+            timeout_event(1.0, "fn"),
+        ]
+        # Explicit timestamps still win
+        assert remove_event([], ts=0)["ts"] == 0
+
+        with event_batch(ts=42):
+            assert add_event([])["ts"] == 42
+        assert current_timestamp() == ts
+
+    assert all(event["ts"] == ts for event in events)
@@ -33,6 +33,64 @@ def test_torch_extension():
     torch.testing.assert_close(decoded, tensor)
 
 
+def test_torch_decode_shares_writable_buffer():
+    """Test that torch decode only copies read-only payloads."""
+    pytest.importorskip("torch")
+    import torch
+    from vuer_rpc.extensions import torch_support  # noqa: F401
+
+    tensor = torch.arange(6, dtype=torch.float32).reshape(2, 3)
+    encoded = ZData.encode(tensor)
+
+    buffer = bytearray(encoded["b"])
+    decoded = ZData.decode({**encoded, "b": buffer})
+    torch.testing.assert_close(decoded, tensor)
+
+    # The tensor aliases the writable buffer
+    decoded[0, 0] = 42.0
+    assert np.frombuffer(buffer, dtype=np.float32)[0] == 42.0
+
+    # Read-only payloads still give an independent, writable tensor
+    decoded = ZData.decode({**encoded, "b": bytes(buffer)})
+    decoded[0, 0] = -1.0
+
+
+def test_extensions_import_torch_lazily():
+    """Test that importing all extensions defers the torch import."""
+    pytest.importorskip("torch")
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from vuer_rpc import ZData, extensions\n"
+        "assert 'torch' not in sys.modules\n"
+        "import torch\n"
+        "tensor = torch.arange(4.0)\n"
+        "decoded = ZData.decode(ZData.encode(tensor))\n"
+        "assert torch.equal(decoded, tensor)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_extensions_import_pil_lazily():
+    """Test that importing all extensions defers the PIL import."""
+    pytest.importorskip("PIL")
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from vuer_rpc import ZData, extensions\n"
+        "assert 'PIL.Image' not in sys.modules\n"
+        "from PIL import Image\n"
+        "img = Image.new('RGB', (4, 4), color='red')\n"
+        "decoded = ZData.decode(ZData.encode(img))\n"
+        "assert decoded.tobytes() == img.tobytes()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_image_extension():
     """Test PIL image extension can be imported and works."""
     pytest.importorskip("PIL")
@@ -52,6 +110,70 @@ def test_image_extension():
     assert decoded.size == img.size
 
 
+def test_image_png_roundtrip_is_lossless():
+    """Test that fast PNG encoding still round-trips pixels exactly."""
+    pytest.importorskip("PIL")
+    from PIL import Image
+    from vuer_rpc.extensions import image_support  # noqa: F401
+
+    pixels = np.random.default_rng(0).integers(0, 256, (32, 48, 3), dtype=np.uint8)
+    img = Image.fromarray(pixels)
+
+    encoded = ZData.encode(img)
+    assert encoded["b"][:8] == b"\x89PNG\r\n\x1a\n"
+
+    decoded = ZData.decode(encoded)
+    np.testing.assert_array_equal(np.asarray(decoded), pixels)
+
+
+def test_image_reencode_reuses_source_bytes():
+    """Test that unmodified decoded images are re-sent without re-encoding."""
+    pytest.importorskip("PIL")
+    from io import BytesIO
+    from PIL import Image
+    from vuer_rpc.extensions import image_support  # noqa: F401
+
+    encoded = ZData.encode(Image.new('RGB', (16, 16), color='red'))
+
+    decoded = ZData.decode(encoded)
+    assert ZData.encode(decoded)["b"] == encoded["b"]
+
+    # draft() changes mode and size without loading pixel data
+    with BytesIO() as buffer:
+        Image.new('RGB', (8, 8), color='red').save(buffer, format="JPEG")
+        jpeg = ZData.decode({"ztype": "image", "b": buffer.getvalue()})
+    jpeg.draft("L", (4, 4))
+    drafted = ZData.decode(ZData.encode(jpeg))
+    assert (drafted.mode, drafted.size) == ("L", (4, 4))
+
+    # Once modified, the image is encoded from its pixels again
+    decoded.putpixel((0, 0), (0, 0, 255))
+    reencoded = ZData.encode(decoded)
+    assert reencoded["b"] != encoded["b"]
+    assert ZData.decode(reencoded).getpixel((0, 0)) == (0, 0, 255)
+
+
+def test_image_encode_as_jpeg():
+    """Test explicit lossy image encoding."""
+    pytest.importorskip("PIL")
+    from PIL import Image
+    from vuer_rpc.extensions.image_support import encode_image
+
+    for mode, color in (("RGB", (200, 30, 30)), ("L", 128)):
+        img = Image.new(mode, (32, 24), color=color)
+        encoded = encode_image(img)
+        assert encoded["b"][:2] == b"\xff\xd8"
+
+        decoded = ZData.decode(encoded)
+        assert decoded.format == "JPEG"
+        assert decoded.mode == mode
+        assert decoded.size == img.size
+
+    # Images with alpha stay lossless
+    rgba = Image.new("RGBA", (8, 8), color=(0, 0, 0, 0))
+    assert encode_image(rgba)["b"][:4] == b"\x89PNG"
+
+
 def test_safetensors_extension():
     """Test safetensors extension can be imported and works."""
     pytest.importorskip("safetensors")
@@ -79,6 +201,59 @@ def test_safetensors_extension():
     np.testing.assert_array_equal(decoded["bias"], data["bias"])
 
 
+def test_safetensors_encode_matches_library_loader():
+    """Test that the single-copy writer produces files safetensors can load."""
+    pytest.importorskip("safetensors")
+    from safetensors.numpy import load
+    from vuer_rpc.extensions.safetensors_support import encode_as_safetensor
+
+    data = {
+        "strided": np.random.randn(6, 8)[:, ::2],
+        "ints": np.arange(5, dtype=np.int16),
+        "flag": np.array(True),
+        "empty": np.zeros((0, 3), dtype=np.float32),
+        "big_endian": np.arange(4, dtype=">f4"),
+    }
+
+    encoded = encode_as_safetensor(data)
+    loaded = load(bytes(encoded["b"]))
+
+    for key, value in data.items():
+        assert loaded[key].dtype == value.dtype.newbyteorder("<")
+        np.testing.assert_array_equal(loaded[key], value)
+
+
+def test_safetensors_decode_is_zero_copy():
+    """Test that decoded safetensors arrays are views over the payload."""
+    pytest.importorskip("safetensors")
+    from safetensors.numpy import save
+    from vuer_rpc.extensions.safetensors_support import encode_as_safetensor
+
+    data = {"weights": np.random.randn(16, 4).astype(np.float32)}
+
+    # Files written by safetensors itself decode the same way
+    for binary in (bytes(encode_as_safetensor(data)["b"]), save(data)):
+        decoded = ZData.decode({"ztype": "safetensor.dict", "b": binary})
+        np.testing.assert_array_equal(decoded["weights"], data["weights"])
+        assert not decoded["weights"].flags.owndata
+        assert not decoded["weights"].flags.writeable
+
+
+def test_safetensors_stdlib_json_fallback(monkeypatch):
+    """Test safetensors header handling without orjson."""
+    pytest.importorskip("safetensors")
+    from vuer_rpc.extensions import safetensors_support
+    from vuer_rpc.extensions.safetensors_support import encode_as_safetensor
+
+    monkeypatch.setattr(safetensors_support, "ORJSON_AVAILABLE", False)
+
+    data = {f"layer{i}": np.full((2, i), i, dtype=np.int32) for i in range(5)}
+    decoded = ZData.decode(encode_as_safetensor(data))
+
+    for key, value in data.items():
+        np.testing.assert_array_equal(decoded[key], value)
+
+
 def test_registry_direct_access():
     """Test that users can access TYPE_REGISTRY directly."""
     # Register a custom type directly via TYPE_REGISTRY
@@ -165,3 +340,25 @@ def test_type_registry_isolation():
 
     # In a real scenario, this type persists across tests within the same session
     # But that's okay - it's the intended behavior of a global registry
+
+
+def test_image_auto_encode_keeps_pil_jpeg_quality():
+    """Test that automatic JPEG re-encoding uses PIL's default quality."""
+    pytest.importorskip("PIL")
+    from io import BytesIO
+    from PIL import Image
+    from vuer_rpc.extensions import image_support  # noqa: F401
+
+    pixels = np.random.default_rng(0).integers(0, 256, (32, 32, 3), dtype=np.uint8)
+    img = Image.fromarray(pixels)
+    with BytesIO() as buffer:
+        img.save(buffer, format="JPEG")
+        source = buffer.getvalue()
+
+    decoded = Image.open(BytesIO(source))
+    decoded.load()  # no longer passed through as-is
+    with BytesIO() as buffer:
+        decoded.save(buffer, format="JPEG")
+        expected = buffer.getvalue()
+
+    assert ZData.encode(decoded)["b"] == expected
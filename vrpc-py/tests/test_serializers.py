@@ -2,16 +2,40 @@
 Tests for MessagePack and JSON serializers.
 """
 
+import math
 import pytest
 import numpy as np
 from vuer_rpc import (
     MessagePackSerializer,
     JSONSerializer,
+    PickleSerializer,
     set_event,
     ZData,
+    TYPE_REGISTRY,
 )
 
 
+@pytest.fixture
+def registry_snapshot():
+    """Restore TYPE_REGISTRY after a test registers types in it."""
+    saved = (
+        dict(TYPE_REGISTRY._encoders),
+        dict(TYPE_REGISTRY._decoders),
+        list(TYPE_REGISTRY._type_checkers),
+        dict(TYPE_REGISTRY._subclass_encoders),
+        TYPE_REGISTRY._passthrough,
+    )
+    yield
+    (
+        TYPE_REGISTRY._encoders,
+        TYPE_REGISTRY._decoders,
+        TYPE_REGISTRY._type_checkers,
+        TYPE_REGISTRY._subclass_encoders,
+        TYPE_REGISTRY._passthrough,
+    ) = saved
+    TYPE_REGISTRY._checker_cache.clear()
+
+
 def test_msgpack_basic_encoding():
     """Test basic MessagePack encoding/decoding."""
     serializer = MessagePackSerializer(greedy=False)
@@ -33,6 +57,18 @@ def test_msgpack_basic_encoding():
     assert decoded == data
 
 
+def test_msgpack_tuples_become_lists():
+    """Test that tuples are sent as arrays and decode as lists."""
+    serializer = MessagePackSerializer(greedy=True)
+
+    data = {"position": (1, 2, 3), "nested": [(np.arange(2), "a")]}
+    decoded = serializer.decode(serializer.encode(data))
+
+    assert decoded["position"] == [1, 2, 3]
+    assert isinstance(decoded["nested"][0], list)
+    np.testing.assert_array_equal(decoded["nested"][0][0], np.arange(2))
+
+
 def test_msgpack_with_numpy():
     """Test MessagePack with numpy arrays (greedy mode)."""
     serializer = MessagePackSerializer(greedy=True)
@@ -82,6 +118,20 @@ def test_msgpack_with_nested_numpy():
     np.testing.assert_array_equal(decoded["list"][1], data["list"][1])
 
 
+def test_msgpack_with_numpy_batch():
+    """Test MessagePack with a batched list of numpy arrays."""
+    serializer = MessagePackSerializer(greedy=True)
+
+    arrays = [np.arange(3), np.arange(4).reshape(2, 2)]
+    data = {"points": ZData.encode_batch(arrays)}
+
+    decoded = serializer.decode(serializer.encode(data))
+
+    assert len(decoded["points"]) == 2
+    for result, arr in zip(decoded["points"], arrays):
+        np.testing.assert_array_equal(result, arr)
+
+
 def test_msgpack_with_torch():
     """Test MessagePack with PyTorch tensors."""
     pytest.importorskip("torch")
@@ -120,6 +170,204 @@ def test_msgpack_event_serialization():
     np.testing.assert_array_equal(decoded["data"]["data"], arr)
 
 
+def test_msgpack_out_of_band_buffers():
+    """Test moving ZData payloads out of band with a buffers list."""
+    serializer = MessagePackSerializer(greedy=True)
+
+    large_arr = np.random.randn(100, 100)
+    data = {
+        "large_array": large_arr,
+        "list": [np.arange(5), "text"],
+    }
+
+    buffers = []
+    encoded = serializer.encode(data, buffers=buffers)
+
+    assert len(buffers) == 2
+    assert len(encoded) < large_arr.nbytes
+
+    decoded = serializer.decode(encoded, buffers=buffers)
+    np.testing.assert_array_equal(decoded["large_array"], large_arr)
+    np.testing.assert_array_equal(decoded["list"][0], data["list"][0])
+    assert decoded["list"][1] == "text"
+
+
+def test_msgpack_out_of_band_ignores_user_keys():
+    """Test that user maps with a "buf_idx" key are left alone."""
+    data = {"cfg": {"buf_idx": 5}, "arr": np.arange(10)}
+
+    buffers = []
+    serializer = MessagePackSerializer()
+    decoded = serializer.decode(serializer.encode(data, buffers=buffers), buffers=buffers)
+    assert decoded["cfg"] == {"buf_idx": 5}
+    np.testing.assert_array_equal(decoded["arr"], data["arr"])
+
+    # Non-plain hooks without buffers, e.g. with mmap enabled
+    serializer = MessagePackSerializer(mmap_threshold=1 << 20)
+    data = {"cfg": {"buf_idx": 5, "compression": "none"}, "arr": np.arange(10)}
+    decoded = serializer.decode(serializer.encode(data))
+    assert decoded["cfg"] == data["cfg"]
+    np.testing.assert_array_equal(decoded["arr"], data["arr"])
+
+
+def test_msgpack_out_of_band_decode_aliases_buffers():
+    """Test that out-of-band decoding returns views over the given buffers."""
+    serializer = MessagePackSerializer(greedy=True)
+
+    arr = np.arange(12, dtype=np.float64).reshape(3, 4)
+    buffers = []
+    encoded = serializer.encode({"array": arr}, buffers=buffers)
+
+    # Simulate buffers landing in transport-owned memory
+    received = [bytearray(buf) for buf in buffers]
+    decoded = serializer.decode(memoryview(encoded), buffers=received)
+
+    result = decoded["array"]
+    np.testing.assert_array_equal(result, arr)
+    assert np.shares_memory(result, np.frombuffer(received[0], dtype=np.uint8))
+    assert result.flags.writeable
+
+
+def test_msgpack_lz4_compression():
+    """Test LZ4 compression of large ZData payloads."""
+    pytest.importorskip("blosc2")
+    serializer = MessagePackSerializer(greedy=True, compression="lz4")
+
+    large_arr = np.tile(np.arange(100, dtype=np.float32), 1000)
+    small_arr = np.arange(10, dtype=np.float32)
+    data = {"large": large_arr, "small": small_arr}
+
+    encoded = serializer.encode(data)
+    assert len(encoded) < large_arr.nbytes // 2
+
+    decoded = serializer.decode(encoded)
+    np.testing.assert_array_equal(decoded["large"], large_arr)
+    np.testing.assert_array_equal(decoded["small"], small_arr)
+
+    # Compression composes with out-of-band buffers
+    buffers = []
+    encoded = serializer.encode(data, buffers=buffers)
+    decoded = serializer.decode(encoded, buffers=buffers)
+    np.testing.assert_array_equal(decoded["large"], large_arr)
+
+
+def test_msgpack_mmap_large_arrays(tmp_path):
+    """Test handing large arrays over through memory-mapped files."""
+    serializer = MessagePackSerializer(mmap_threshold=1 << 16, mmap_dir=str(tmp_path))
+
+    large_arr = np.random.randn(100, 100)
+    small_arr = np.arange(10)
+    encoded = serializer.encode({"large": large_arr, "small": small_arr})
+
+    assert len(encoded) < 1024
+    assert len(list(tmp_path.iterdir())) == 1
+
+    decoded = serializer.decode(encoded)
+    assert isinstance(decoded["large"], np.memmap)
+    np.testing.assert_array_equal(decoded["large"], large_arr)
+    np.testing.assert_array_equal(decoded["small"], small_arr)
+    # The file is removed once mapped
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_msgpack_mmap_cleans_up_failed_encode(tmp_path):
+    """Test that files written for a message that fails to encode are removed."""
+    serializer = MessagePackSerializer(mmap_threshold=1 << 10, mmap_dir=str(tmp_path))
+
+    class Opaque:
+        pass
+
+    with pytest.raises(TypeError):
+        serializer.encode({"a": np.zeros(10000), "bad": Opaque()})
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_msgpack_mmap_rejects_foreign_paths(tmp_path):
+    """Test that mmap descriptors may only point into the serializer's directory."""
+    serializer = MessagePackSerializer(mmap_threshold=1, mmap_dir=str(tmp_path / "shm"))
+    (tmp_path / "shm").mkdir()
+    foreign = tmp_path / "vuer-foreign"
+    np.arange(4).tofile(foreign)
+
+    message = {"ztype": "numpy.ndarray.mmap", "path": str(foreign), "dtype": "int64", "shape": [4]}
+    with pytest.raises(ValueError, match="Refusing to map"):
+        serializer.decode(MessagePackSerializer().encode(message))
+    assert foreign.exists()
+
+
+def test_msgpack_compression_ignores_user_keys():
+    """Test that user maps with a "compression" key are left alone."""
+    pytest.importorskip("blosc2")
+    serializer = MessagePackSerializer(compression="lz4")
+
+    data = {"cfg": {"compression": "gzip"}, "arr": np.zeros(10)}
+    decoded = serializer.decode(serializer.encode(data))
+    assert decoded["cfg"] == {"compression": "gzip"}
+    np.testing.assert_array_equal(decoded["arr"], data["arr"])
+
+
+def test_msgpack_compressed_payload_default_receiver():
+    """Test that a receiver without compression still decompresses payloads."""
+    pytest.importorskip("blosc2")
+    sender = MessagePackSerializer(compression="lz4", compression_threshold=0)
+
+    arr = np.tile(np.arange(100, dtype=np.float32), 100)
+    encoded = sender.encode({"arr": arr})
+    assert b"compression" in encoded
+
+    decoded = MessagePackSerializer().decode(encoded)
+    np.testing.assert_array_equal(decoded["arr"], arr)
+    decoded = MessagePackSerializer().decode(memoryview(encoded))
+    np.testing.assert_array_equal(decoded["arr"], arr)
+
+
+def test_msgpack_compressed_payload_errors(monkeypatch):
+    """Test that undecodable compressed payloads fail with the codec named."""
+    from vuer_rpc import serializers
+
+    def message(codec):
+        zdata = {"ztype": "numpy.ndarray", "b": b"\0" * 4, "dtype": "uint8",
+                 "shape": [4], "compression": codec}
+        return MessagePackSerializer().encode({"arr": zdata})
+
+    with pytest.raises(ValueError, match="'gzip'"):
+        MessagePackSerializer().decode(message("gzip"))
+
+    monkeypatch.setattr(serializers, "BLOSC2_AVAILABLE", False)
+    with pytest.raises(ValueError, match="'lz4'"):
+        MessagePackSerializer().decode(message("lz4"))
+
+
+def test_msgpack_unknown_compression_raises():
+    """Test that unsupported compression codecs are rejected."""
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        MessagePackSerializer(compression="zip")
+
+
+def test_pickle_out_of_band_buffers():
+    """Test pickle protocol 5 with out-of-band array buffers."""
+    serializer = PickleSerializer()
+
+    large_arr = np.random.randn(100, 100)
+    data = {"large": large_arr, "nested": [np.arange(5), ("text", 1)]}
+
+    # In band
+    decoded = serializer.decode(serializer.encode(data))
+    np.testing.assert_array_equal(decoded["large"], large_arr)
+    assert decoded["nested"][1] == ("text", 1)
+
+    buffers = []
+    encoded = serializer.encode(data, buffers=buffers)
+    assert len(buffers) == 2
+    assert len(encoded) < 1024
+
+    received = [bytearray(buf) for buf in buffers]
+    decoded = serializer.decode(encoded, buffers=received)
+    np.testing.assert_array_equal(decoded["large"], large_arr)
+    np.testing.assert_array_equal(decoded["nested"][0], data["nested"][0])
+    assert np.shares_memory(decoded["large"], np.frombuffer(received[0], dtype=np.uint8))
+
+
 def test_json_basic_encoding():
     """Test basic JSON encoding/decoding."""
     serializer = JSONSerializer(greedy=False)
@@ -175,6 +423,141 @@ def test_json_bytes_encoding():
     assert isinstance(decoded["b"], bytes)
 
 
+def test_json_tuples_become_lists():
+    """Test that tuples are sent as arrays and decode as lists."""
+    serializer = JSONSerializer(greedy=True)
+
+    data = {"pos": (1, 2, 3), "nested": [(0.5, "a"), ((True,),)]}
+    decoded = serializer.decode(serializer.encode(data))
+
+    assert decoded == {"pos": [1, 2, 3], "nested": [[0.5, "a"], [[True]]]}
+
+
+def test_json_numeric_arrays_as_lists():
+    """Test that numeric arrays are sent as number lists, not base64."""
+    serializer = JSONSerializer(greedy=True)
+
+    data = {
+        "float32": np.array([[0.1, 2.5], [3.0, -4.0]], dtype=np.float32),
+        "int64": np.arange(6, dtype=np.int64).reshape(2, 3),
+        "bool": np.array([True, False]),
+        "empty": np.zeros((0, 3)),
+    }
+
+    encoded = serializer.encode(data)
+    assert b"__bytes__" not in encoded
+
+    decoded = serializer.decode(encoded)
+    for key, arr in data.items():
+        assert decoded[key].dtype == arr.dtype
+        assert decoded[key].shape == arr.shape
+        np.testing.assert_array_equal(decoded[key], arr)
+
+
+def test_json_non_numeric_arrays_use_base64():
+    """Test that arrays a number list cannot represent fall back to base64."""
+    serializer = JSONSerializer(greedy=True)
+
+    data = {
+        "complex": np.array([1 + 2j, 3 - 4j]),
+        "nan": np.array([1.0, np.nan, np.inf]),
+    }
+
+    encoded = serializer.encode(data)
+    assert b"__bytes__" in encoded
+
+    decoded = serializer.decode(encoded)
+    np.testing.assert_array_equal(decoded["complex"], data["complex"])
+    np.testing.assert_array_equal(decoded["nan"], data["nan"])
+
+
+def test_json_numpy_scalars():
+    """Test that numpy scalars are written as plain JSON numbers."""
+    serializer = JSONSerializer(greedy=True)
+
+    data = {"count": np.int64(3), "scale": np.float32(0.5)}
+    decoded = serializer.decode(serializer.encode(data))
+
+    assert decoded == {"count": 3, "scale": 0.5}
+
+
+def test_json_stdlib_fallback(monkeypatch):
+    """Test that JSONSerializer works with the stdlib json backend."""
+    from vuer_rpc import serializers
+    monkeypatch.setattr(serializers, "ORJSON_AVAILABLE", False)
+
+    serializer = JSONSerializer(greedy=True)
+    arr = np.array([[1.0, 2.0], [3.0, 4.0]])
+    data = {"array": arr, "text": "hello", "list": [1, 2, 3]}
+
+    encoded = serializer.encode(data)
+    assert isinstance(encoded, bytes)
+
+    decoded = serializer.decode(encoded)
+    assert decoded["text"] == "hello"
+    assert decoded["list"] == [1, 2, 3]
+    np.testing.assert_array_equal(decoded["array"], arr)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_non_greedy_rejects_arrays(monkeypatch, use_orjson):
+    """Test that non-greedy JSON rejects raw arrays with either backend."""
+    from vuer_rpc import serializers
+    if use_orjson and not serializers.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serializers, "ORJSON_AVAILABLE", use_orjson)
+
+    serializer = JSONSerializer(greedy=False)
+    with pytest.raises(TypeError):
+        serializer.encode({"array": np.arange(3)})
+    assert serializer.decode(serializer.encode({"n": np.int64(3)})) == {"n": 3}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_non_finite_and_big_ints(monkeypatch, use_orjson):
+    """Test that NaN, infinity and big integers round-trip on either backend."""
+    from vuer_rpc import serializers
+    if use_orjson and not serializers.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serializers, "ORJSON_AVAILABLE", use_orjson)
+
+    serializer = JSONSerializer(greedy=True)
+    data = {
+        "nan": float("nan"),
+        "inf": [float("inf"), np.float32("-inf")],
+        "big": 2**70,
+        "neg": -(10**19),
+        "none": None,
+    }
+    decoded = serializer.decode(serializer.encode(data))
+
+    assert math.isnan(decoded["nan"])
+    assert decoded["inf"] == [math.inf, -math.inf]
+    assert decoded["big"] == 2**70
+    assert decoded["neg"] == -(10**19)
+    assert decoded["none"] is None
+    assert serializer.decode(serializer.encode({"n": None})) == {"n": None}
+
+
+def test_json_does_not_mutate_input():
+    """Test that JSON encoding leaves the input structure untouched."""
+    serializer = JSONSerializer(greedy=True)
+
+    arr = np.array([1, 2, 3])
+    data = {
+        "nested": {"array": arr, "text": "hello"},
+        "plain": {"list": [1, 2, 3]},
+    }
+
+    encoded = serializer.encode(data)
+    assert data["nested"]["array"] is arr
+    assert data["plain"] == {"list": [1, 2, 3]}
+
+    decoded = serializer.decode(encoded)
+    np.testing.assert_array_equal(decoded["nested"]["array"], arr)
+    assert decoded["plain"] == data["plain"]
+
+
 def test_serializer_greedy_vs_non_greedy():
     """Test difference between greedy and non-greedy modes."""
     arr = np.array([1, 2, 3])
@@ -247,3 +630,121 @@ def test_empty_structures():
     assert decoded["empty_dict"] == {}
     assert decoded["empty_list"] == []
     assert len(decoded["empty_array"]) == 0
+
+
+def test_msgpack_native_subclasses_pack_as_native(registry_snapshot):
+    """Test that registered subclasses of native types are packed natively."""
+    class Fahrenheit(float):
+        pass
+
+    ZData.register_type(
+        "test.Fahrenheit",
+        lambda f: {"ztype": "test.Fahrenheit", "b": repr(float(f)).encode()},
+        lambda z: Fahrenheit(float(z["b"])),
+        type_class=Fahrenheit,
+    )
+
+    # msgpack packs float subclasses itself and never calls the default hook
+    serializer = MessagePackSerializer(greedy=True)
+    decoded = serializer.decode(serializer.encode({"t": Fahrenheit(98.6)}))
+    assert type(decoded["t"]) is float
+    assert decoded["t"] == 98.6
+
+    # The registry itself still encodes them
+    assert type(ZData.decode(ZData.encode(Fahrenheit(98.6)))) is Fahrenheit
+
+
+def test_msgpack_unsupported_type_raises():
+    """Test that objects without a registered encoder raise TypeError."""
+    serializer = MessagePackSerializer(greedy=True)
+
+    class Opaque:
+        pass
+
+    with pytest.raises(TypeError):
+        serializer.encode({"value": Opaque()})
+
+
+def test_msgpack_non_greedy_has_no_hooks():
+    """Test that non-greedy mode leaves ZData handling to the caller."""
+    serializer = MessagePackSerializer(greedy=False)
+
+    with pytest.raises(TypeError):
+        serializer.encode({"array": np.array([1, 2, 3])})
+
+    # ZData dicts pass through as plain maps
+    zdata = ZData.encode(np.array([1, 2, 3]))
+    decoded = serializer.decode(serializer.encode({"array": zdata}))
+    assert decoded["array"]["ztype"] == "numpy.ndarray"
+    assert isinstance(decoded["array"]["b"], bytes)
+
+
+def test_msgpack_skips_object_hook_without_zdata(monkeypatch):
+    """Test that messages without ZData are decoded without the object hook."""
+    calls = []
+    decode = TYPE_REGISTRY.decode
+    monkeypatch.setattr(TYPE_REGISTRY, "decode", lambda obj: calls.append(obj) or decode(obj))
+    serializer = MessagePackSerializer(greedy=True)
+
+    plain = {"tag": "scene", "children": [{"tag": "mesh", "position": [0, 1, 2]}]}
+    assert serializer.decode(serializer.encode(plain)) == plain
+    assert calls == []
+
+    decoded = serializer.decode(serializer.encode({"array": np.arange(3)}))
+    np.testing.assert_array_equal(decoded["array"], np.arange(3))
+    assert calls
+
+
+def test_msgpack_serializer_reuse():
+    """Test that a serializer stays usable across calls and after errors."""
+    serializer = MessagePackSerializer(greedy=True)
+
+    class Opaque:
+        pass
+
+    with pytest.raises(TypeError):
+        serializer.encode({"value": Opaque(), "text": "partial"})
+
+    for i in range(3):
+        data = {"index": i, "array": np.arange(i + 1)}
+        decoded = serializer.decode(serializer.encode(data))
+        assert decoded["index"] == i
+        np.testing.assert_array_equal(decoded["array"], data["array"])
+
+
+def test_msgpack_reentrant_encode(registry_snapshot):
+    """Test that encoders may call the serializer they are running under."""
+    class Wrapped:
+        def __init__(self, value, serializer=None):
+            self.value = value
+            self.serializer = serializer
+
+    # The encoder packs with whichever serializer the object was created for
+    ZData.register_type(
+        "test.Wrapped",
+        lambda w: {"ztype": "test.Wrapped", "b": w.serializer.encode({"inner": w.value})},
+        lambda z: Wrapped(MessagePackSerializer().decode(z["b"])["inner"]),
+        type_class=Wrapped,
+    )
+
+    serializer = MessagePackSerializer(greedy=True)
+    arr = np.arange(4)
+    buffers = []
+    encoded = serializer.encode(
+        {"w": Wrapped(arr, serializer), "outer": arr}, buffers=buffers
+    )
+    decoded = serializer.decode(encoded, buffers=buffers)
+    np.testing.assert_array_equal(decoded["w"].value, arr)
+    np.testing.assert_array_equal(decoded["outer"], arr)
+
+
+def test_msgpack_drops_oversized_packer_buffer():
+    """Test that a large message does not pin its buffer in the serializer."""
+    serializer = MessagePackSerializer(greedy=True)
+    packer = serializer._packer
+
+    serializer.encode({"small": np.arange(10)})
+    assert serializer._packer is packer
+
+    serializer.encode({"large": np.zeros(1 << 18)})
+    assert serializer._packer is not packer
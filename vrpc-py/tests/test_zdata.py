@@ -45,6 +45,145 @@ def test_numpy_dtypes():
         np.testing.assert_array_equal(decoded, arr)
 
 
+def test_numpy_dtype_strings_are_exact():
+    """Test that cached dtype strings match str(dtype) for each dtype."""
+    for dtype in ("float32", ">f4", "<i8", "bool", "U3", "complex64", "M8[ms]", "m8[s]"):
+        arr = np.zeros(2, dtype=dtype)
+        for _ in range(2):
+            encoded = ZData.encode(arr)
+            assert encoded["dtype"] == str(arr.dtype)
+        assert ZData.decode(encoded).dtype == arr.dtype
+
+
+def test_numpy_subclass_encode(tmp_path):
+    """Test that ndarray subclasses use the numpy encoder."""
+    arr = np.lib.format.open_memmap(tmp_path / "a.npy", mode="w+", dtype=np.float32, shape=(3, 2))
+    arr[:] = np.arange(6).reshape(3, 2)
+
+    encoded = ZData.encode(arr)
+    assert encoded["ztype"] == "numpy.ndarray"
+    np.testing.assert_array_equal(ZData.decode(encoded), arr)
+
+
+def test_numpy_masked_array_rejected():
+    """Test that masked arrays are not encoded without their mask."""
+    arr = np.ma.masked_array([1, 2, 3], mask=[False, True, False])
+
+    with pytest.raises(TypeError, match="MaskedArray"):
+        ZData.encode(arr)
+    with pytest.raises(TypeError, match="MaskedArray"):
+        ZData.encode_batch([np.array([1, 2]), arr])
+
+
+def test_numpy_matrix_rejected():
+    """Test that np.matrix is not silently encoded as a plain ndarray."""
+    with pytest.warns(PendingDeprecationWarning):
+        matrix = np.matrix([[1, 2], [3, 4]])
+    with pytest.raises(TypeError, match="matrix"):
+        ZData.encode(matrix)
+
+
+def test_subclass_type_checker_takes_precedence():
+    """Test that a checker for a subclass wins over its base type class."""
+    from vuer_rpc.type_registry import TypeRegistry
+
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    registry = TypeRegistry()
+    registry.register(
+        "test.Base", lambda x: {"ztype": "test.Base"}, lambda z: Base(),
+        type_class=Base, include_subclasses=True,
+    )
+    registry.register(
+        "test.Child", lambda x: {"ztype": "test.Child"}, lambda z: Child(),
+        type_checker=lambda x: isinstance(x, Child), cache_by_type=True,
+    )
+
+    assert registry.encode(Base())["ztype"] == "test.Base"
+    assert registry.encode(Child())["ztype"] == "test.Child"
+
+
+def test_subclasses_not_matched_by_default():
+    """Test that a type class only claims its subclasses when opted in."""
+    from vuer_rpc.type_registry import TypeRegistry
+
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    registry = TypeRegistry()
+    registry.register(
+        "test.Base", lambda x: {"ztype": "test.Base"}, lambda z: Base(), type_class=Base
+    )
+
+    child = Child()
+    assert registry.encode(Base())["ztype"] == "test.Base"
+    assert registry.encode(child) is child
+
+
+def test_numpy_empty_arrays():
+    """Test encoding arrays with a zero-length dimension."""
+    for arr in (np.zeros(0), np.zeros((0, 3), dtype=np.int16), np.zeros((2, 0, 4))):
+        decoded = ZData.decode(ZData.encode(arr))
+        assert decoded.shape == arr.shape
+        assert decoded.dtype == arr.dtype
+
+    decoded = ZData.decode(ZData.encode_batch([np.zeros(0), np.zeros((0, 2))]))
+    assert [a.shape for a in decoded] == [(0,), (0, 2)]
+
+
+def test_numpy_non_contiguous():
+    """Test that non-contiguous arrays are encoded in C order."""
+    # Small payloads are copied, large ones viewed through a contiguous copy
+    for arr in (
+        np.arange(12, dtype=np.int32).reshape(3, 4).T,
+        np.arange(20000, dtype=np.int32).reshape(100, 200).T,
+    ):
+        assert not arr.flags.c_contiguous
+
+        encoded = ZData.encode(arr)
+        assert bytes(encoded["b"]) == arr.tobytes()
+        assert encoded["shape"] == arr.shape
+
+        decoded = ZData.decode(encoded)
+        np.testing.assert_array_equal(decoded, arr)
+
+
+def test_numpy_batch_encode_decode():
+    """Test batching several same-dtype arrays into one ZData record."""
+    arrays = [
+        np.arange(4, dtype=np.float32),
+        np.ones((2, 3), dtype=np.float32),
+        np.arange(6, dtype=np.float32).reshape(3, 2).T,
+        np.zeros(0, dtype=np.float32),
+    ]
+
+    encoded = ZData.encode_batch(arrays)
+    assert encoded["ztype"] == "numpy.ndarray.batch"
+    assert len(encoded["b"]) == sum(a.nbytes for a in arrays)
+
+    decoded = ZData.decode(encoded)
+    assert len(decoded) == len(arrays)
+    for result, arr in zip(decoded, arrays):
+        assert result.dtype == arr.dtype
+        np.testing.assert_array_equal(result, arr)
+
+    stamps = [np.arange(3).astype("M8[ms]"), np.arange(2).astype("M8[ms]")]
+    for result, arr in zip(ZData.decode(ZData.encode_batch(stamps)), stamps):
+        np.testing.assert_array_equal(result, arr)
+
+    with pytest.raises(TypeError):
+        ZData.encode_batch([np.zeros(2, dtype=np.int32), np.zeros(2)])
+    with pytest.raises(ValueError):
+        ZData.encode_batch([])
+
+
 def test_torch_encode_decode():
     """Test encoding and decoding of PyTorch tensors."""
     pytest.importorskip("torch")
@@ -209,6 +348,172 @@ def test_custom_type_with_checker():
     assert decoded == vec
 
 
+def test_struct_codec():
+    """Test the struct-based encoder/decoder helper."""
+    import struct
+    from vuer_rpc import struct_codec
+
+    class Pose:
+        def __init__(self, x, y, frame):
+            self.x, self.y, self.frame = x, y, frame
+
+    class Scale:
+        def __init__(self, s):
+            self.s = s
+
+    ZData.register_type(
+        "test.Pose",
+        *struct_codec("test.Pose", "<2dI", Pose, ("x", "y", "frame")),
+        type_class=Pose,
+    )
+    ZData.register_type(
+        "test.Scale", *struct_codec("test.Scale", "<f", Scale, ("s",)), type_class=Scale
+    )
+
+    encoded = ZData.encode(Pose(1.5, -2.0, 7))
+    assert encoded == {"ztype": "test.Pose", "b": struct.pack("<2dI", 1.5, -2.0, 7)}
+    decoded = ZData.decode(encoded)
+    assert (decoded.x, decoded.y, decoded.frame) == (1.5, -2.0, 7)
+
+    assert ZData.decode(ZData.encode(Scale(0.5))).s == 0.5
+
+
+def test_has_type():
+    """Test registered type membership check."""
+    assert ZData.has_type("numpy.ndarray")
+    assert not ZData.has_type("does.not.exist")
+
+
+def test_module_level_functions():
+    """Test the module-level aliases of the ZData methods."""
+    from vuer_rpc import zdata
+
+    arr = np.arange(6).reshape(2, 3)
+    encoded = zdata.encode(arr)
+    assert zdata.is_zdata(encoded)
+    assert zdata.get_ztype(encoded) == "numpy.ndarray"
+    np.testing.assert_array_equal(zdata.decode(encoded), arr)
+    assert zdata.has_type("numpy.ndarray")
+    assert zdata.list_types() == ZData.list_types()
+
+
+def test_register_many():
+    """Test registering several types in one call."""
+    from vuer_rpc.type_registry import TypeRegistry
+
+    class Point:
+        def __init__(self, x):
+            self.x = x
+
+    class Shape:
+        pass
+
+    registry = TypeRegistry()
+    registry.register_many([
+        ("test.Point", lambda p: {"ztype": "test.Point", "b": bytes([p.x])},
+         lambda z: Point(z["b"][0]), Point),
+        ("test.Shape", lambda s: {"ztype": "test.Shape", "b": b""},
+         lambda z: Shape(), None, lambda obj: isinstance(obj, Shape)),
+        ("test.int", lambda i: {"ztype": "test.int", "b": b""}, lambda z: 0, int),
+    ])
+
+    assert registry.list_registered_types() == ["test.Point", "test.Shape", "test.int"]
+    assert registry.decode(registry.encode(Point(7))).x == 7
+    assert isinstance(registry.decode(registry.encode(Shape())), Shape)
+    # Registered primitives no longer pass through
+    assert registry.encode(5)["ztype"] == "test.int"
+
+
+def test_type_checker_match_is_memoized():
+    """Test that a cache_by_type checker runs once per concrete type."""
+    from vuer_rpc import TypeRegistry
+
+    registry = TypeRegistry()
+    calls = []
+
+    class Celsius:
+        def __init__(self, degrees):
+            self.degrees = degrees
+
+    def is_celsius(obj):
+        calls.append(type(obj))
+        return isinstance(obj, Celsius)
+
+    registry.register(
+        "custom.Celsius",
+        lambda c: {"ztype": "custom.Celsius", "b": str(c.degrees).encode()},
+        lambda z: Celsius(float(z["b"].decode())),
+        type_checker=is_celsius,
+        cache_by_type=True,
+    )
+
+    for degrees in (1.0, 2.0, 3.0):
+        encoded = registry.encode(Celsius(degrees))
+        assert encoded["ztype"] == "custom.Celsius"
+        assert registry.decode(encoded).degrees == degrees
+
+    assert calls.count(Celsius) == 1
+
+    # Types no checker claims are memoized as misses
+    class Kelvin:
+        pass
+
+    kelvin = Kelvin()
+    assert registry.encode(kelvin) is kelvin
+    assert registry.encode(kelvin) is kelvin
+    assert calls.count(Kelvin) == 1
+
+
+def test_instance_type_checker_is_not_memoized():
+    """Test that checkers inspecting instances are consulted for every object."""
+    from vuer_rpc import TypeRegistry
+
+    class Config(dict):
+        pass
+
+    def is_array_config(obj):
+        return isinstance(obj, Config) and all(
+            isinstance(v, np.ndarray) for v in obj.values()
+        )
+
+    registry = TypeRegistry()
+    registry.register(
+        "test.ArrayConfig",
+        lambda c: {"ztype": "test.ArrayConfig", "b": b""},
+        lambda z: Config(),
+        type_checker=is_array_config,
+    )
+
+    plain = Config(a=1)
+    assert registry.encode(plain) is plain
+    assert registry.encode(Config(w=np.zeros(2)))["ztype"] == "test.ArrayConfig"
+    assert registry.encode(plain) is plain
+
+
+def test_type_checker_cache_is_bounded():
+    """Test that memoized checker matches do not grow without bound."""
+    from vuer_rpc import TypeRegistry
+    from vuer_rpc.type_registry import _CHECKER_CACHE_SIZE
+
+    class Base:
+        pass
+
+    registry = TypeRegistry()
+    registry.register(
+        "custom.Base",
+        lambda obj: {"ztype": "custom.Base", "b": b""},
+        lambda z: Base(),
+        type_checker=lambda obj: isinstance(obj, Base),
+        cache_by_type=True,
+    )
+
+    for i in range(_CHECKER_CACHE_SIZE + 10):
+        subclass = type(f"Sub{i}", (Base,), {})
+        assert registry.encode(subclass())["ztype"] == "custom.Base"
+
+    assert len(registry._checker_cache) <= _CHECKER_CACHE_SIZE
+
+
 def test_unknown_ztype_raises_error():
     """Test that unknown ztype raises TypeError."""
     fake_zdata = {